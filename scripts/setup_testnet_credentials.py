@@ -7,13 +7,23 @@ from pathlib import Path
 from getpass import getpass
 import re
 
+# Keys this script manages in .env (matched in a single pass when rewriting)
+ENV_KEY_PATTERN = re.compile(
+    rb'^(BINANCE_TESTNET_API_KEY|BINANCE_TESTNET_API_SECRET|TELEGRAM_BOT_TOKEN|TELEGRAM_CHAT_ID)=.*$',
+    re.M,
+)
+
+def _is_64_ascii_alnum(value: str) -> bool:
+    """Check for exactly 64 ASCII alphanumeric characters (no regex needed)."""
+    return len(value) == 64 and value.isascii() and value.isalnum()
+
 def validate_api_key(key: str) -> bool:
     """Validate API key format (64 character alphanumeric)."""
-    return bool(re.match(r'^[A-Za-z0-9]{64}$', key))
+    return _is_64_ascii_alnum(key)
 
 def validate_api_secret(secret: str) -> bool:
     """Validate API secret format (64 character alphanumeric)."""
-    return bool(re.match(r'^[A-Za-z0-9]{64}$', secret))
+    return _is_64_ascii_alnum(secret)
 
 def main():
     print("\n" + "="*60)
@@ -122,28 +132,38 @@ def main():
     print("UPDATING CONFIGURATION...")
     print("-"*60)
 
-    # Read all lines
-    with open(env_file, 'r') as f:
-        lines = f.readlines()
-
-    # Update values
-    updated = False
-    for i, line in enumerate(lines):
-        if line.startswith('BINANCE_TESTNET_API_KEY='):
-            lines[i] = f'BINANCE_TESTNET_API_KEY="{api_key}"\n'
-            updated = True
-        elif line.startswith('BINANCE_TESTNET_API_SECRET='):
-            lines[i] = f'BINANCE_TESTNET_API_SECRET="{api_secret}"\n'
-            updated = True
-        elif setup_telegram in ['yes', 'y']:
-            if telegram_token and line.startswith('TELEGRAM_BOT_TOKEN='):
-                lines[i] = f'TELEGRAM_BOT_TOKEN="{telegram_token}"\n'
-            elif telegram_chat and line.startswith('TELEGRAM_CHAT_ID='):
-                lines[i] = f'TELEGRAM_CHAT_ID="{telegram_chat}"\n'
-
-    # Write back
-    with open(env_file, 'w') as f:
-        f.writelines(lines)
+    new_values = {
+        b'BINANCE_TESTNET_API_KEY': api_key.encode(),
+        b'BINANCE_TESTNET_API_SECRET': api_secret.encode(),
+    }
+    if setup_telegram in ['yes', 'y']:
+        if telegram_token:
+            new_values[b'TELEGRAM_BOT_TOKEN'] = telegram_token.encode()
+        if telegram_chat:
+            new_values[b'TELEGRAM_CHAT_ID'] = telegram_chat.encode()
+
+    replaced = set()
+
+    def substitute(match):
+        key = match.group(1)
+        if key not in new_values:
+            return match.group(0)
+        replaced.add(key)
+        return key + b'="' + new_values[key] + b'"'
+
+    data = ENV_KEY_PATTERN.sub(substitute, env_file.read_bytes())
+
+    # Write back atomically. The temp file is created owner-only so secrets are
+    # never readable by others, then takes the original file's permissions
+    import shutil
+    tmp_file = env_file.with_name(env_file.name + '.tmp')
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    shutil.copymode(env_file, tmp_file)
+    os.replace(tmp_file, env_file)
+
+    updated = {b'BINANCE_TESTNET_API_KEY', b'BINANCE_TESTNET_API_SECRET'} <= replaced
 
     if updated:
         print("✅ Configuration updated successfully!")
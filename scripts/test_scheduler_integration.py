@@ -10,7 +10,9 @@ This script:
 
 import signal
 import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
@@ -19,12 +21,15 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Set by signal_handler to end the monitor loop early
+stop_event = threading.Event()
+
 
 def signal_handler(signum: int, frame: object) -> None:
     """Handle SIGINT (Ctrl+C) for graceful shutdown."""
     sig_name = signal.Signals(signum).name
     logger.info(f"\nReceived signal {sig_name} - initiating shutdown...")
-    sys.exit(0)
+    stop_event.set()
 
 
 def main() -> int:
@@ -74,20 +79,18 @@ def main() -> int:
     logger.info(f"\n--- Running for {TEST_DURATION_SECONDS}s ---")
     logger.info("Press Ctrl+C to stop early\n")
 
-    try:
-        elapsed = 0
-        while elapsed < TEST_DURATION_SECONDS:
-            time.sleep(10)  # Check every 10 seconds
-            elapsed = (datetime.now() - start_time).total_seconds()
-
-            # Log progress every minute
-            if int(elapsed) % 60 == 0 and elapsed > 0:
-                logger.info(
-                    f"Running... {int(elapsed)}s / {TEST_DURATION_SECONDS}s "
-                    f"({elapsed/TEST_DURATION_SECONDS*100:.0f}%)"
-                )
-
-    except KeyboardInterrupt:
+    # Wake once a minute to log progress, or immediately when interrupted
+    deadline = time.monotonic() + TEST_DURATION_SECONDS
+    while not stop_event.wait(timeout=max(0.0, min(60, deadline - time.monotonic()))):
+        if time.monotonic() >= deadline:
+            break
+        elapsed = (datetime.now() - start_time).total_seconds()
+        logger.info(
+            f"Running... {int(elapsed)}s / {TEST_DURATION_SECONDS}s "
+            f"({elapsed/TEST_DURATION_SECONDS*100:.0f}%)"
+        )
+
+    if stop_event.is_set():
         logger.info("\n⚠️ Test interrupted by user")
 
     # Stop scheduler gracefully
@@ -101,23 +104,30 @@ def main() -> int:
     # Check logs
     log_file = Path("logs/scheduler.log")
     if log_file.exists():
-        with open(log_file) as f:
-            lines = f.readlines()
-            logger.info(f"✅ Scheduler log exists: {len(lines)} lines")
-
-            # Count signal check executions
-            signal_check_lines = [line for line in lines if "Signal check" in line]
-            logger.info(f"✅ Signal check log entries: {len(signal_check_lines)}")
-
-            # Check for errors
-            error_lines = [line for line in lines if "ERROR" in line]
-            if error_lines:
-                logger.warning(f"⚠️ Errors found in log: {len(error_lines)}")
-                logger.warning("Recent errors:")
-                for line in error_lines[-5:]:
-                    logger.warning(f"  {line.strip()}")
-            else:
-                logger.info("✅ No errors in scheduler log")
+        # Single streaming pass: count matches, keep only the last few errors
+        total_lines = signal_checks = error_count = 0
+        recent_errors: deque[bytes] = deque(maxlen=5)
+        # Match bytes literals so lines are only decoded when they are logged
+        with open(log_file, "rb") as f:
+            for line in f:
+                total_lines += 1
+                if b"Signal check" in line:
+                    signal_checks += 1
+                if b"ERROR" in line:
+                    error_count += 1
+                    recent_errors.append(line)
+
+        logger.info(f"✅ Scheduler log exists: {total_lines} lines")
+        logger.info(f"✅ Signal check log entries: {signal_checks}")
+
+        # Check for errors
+        if error_count:
+            logger.warning(f"⚠️ Errors found in log: {error_count}")
+            logger.warning("Recent errors:")
+            for line in recent_errors:
+                logger.warning(f"  {line.decode(errors='replace').strip()}")
+        else:
+            logger.info("✅ No errors in scheduler log")
     else:
         logger.error("❌ Scheduler log not found")
         return 1
@@ -125,22 +135,24 @@ def main() -> int:
     # Check paper trader log
     paper_log = Path("logs/paper_trader.log")
     if paper_log.exists():
-        with open(paper_log) as f:
-            lines = f.readlines()
-            logger.info(f"✅ Paper trader log exists: {len(lines)} lines")
-
-            # Count strategy runs
-            strategy_runs = [line for line in lines if "Running strategy for" in line]
-            logger.info(f"✅ Strategy executions: {len(strategy_runs)}")
+        total_lines = strategy_runs = 0
+        with open(paper_log, "rb") as f:
+            for line in f:
+                total_lines += 1
+                if b"Running strategy for" in line:
+                    strategy_runs += 1
+
+        logger.info(f"✅ Paper trader log exists: {total_lines} lines")
+        logger.info(f"✅ Strategy executions: {strategy_runs}")
     else:
         logger.warning("⚠️ Paper trader log not found (may be normal if no signals)")
 
     # Check audit trail
     audit_file = Path("logs/audit_trail.jsonl")
     if audit_file.exists():
-        with open(audit_file) as f:
-            lines = [line for line in f if line.strip()]
-            logger.info(f"✅ Audit trail entries: {len(lines)}")
+        with open(audit_file, "rb") as f:
+            entries = sum(1 for line in f if line.strip())
+        logger.info(f"✅ Audit trail entries: {entries}")
     else:
         logger.warning("⚠️ Audit trail not found")
 
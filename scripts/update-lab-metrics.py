@@ -7,8 +7,14 @@ by querying the LAB workspace infrastructure.
 Run periodically (e.g., every 30s) to keep Grafana dashboard current.
 """
 
+import json
+import os
+import re
 import sys
 import subprocess
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 
 # Add src to path for prometheus_metrics import
@@ -18,7 +24,7 @@ from src.monitoring import prometheus_metrics
 
 
 # MCP servers configured in ~/LAB/.mcp.json
-MCP_SERVERS = [
+MCP_SERVERS: tuple[str, ...] = (
     "filesystem",
     "fetch",
     "sqlite",
@@ -37,16 +43,68 @@ MCP_SERVERS = [
     "cloudflare-bindings",
     "cloudflare-observability",
     "rag-query",
-]
+)
+
+# LAB workspace root
+LAB_DIR = Path.home() / "LAB"
 
 # Worktree paths and names
-WORKTREES = {
-    "main": Path.home() / "LAB",
-    "dev": Path.home() / "LAB" / "worktrees" / "dev",
-    "experimental": Path.home() / "LAB" / "worktrees" / "experimental",
-    "cloudflare": Path.home() / "LAB" / "worktrees" / "cloudflare",
-    "thunes": Path.home() / "LAB" / "worktrees" / "thunes",
-}
+WORKTREES = types.MappingProxyType(
+    {
+        "main": LAB_DIR,
+        "dev": LAB_DIR / "worktrees" / "dev",
+        "experimental": LAB_DIR / "worktrees" / "experimental",
+        "cloudflare": LAB_DIR / "worktrees" / "cloudflare",
+        "thunes": LAB_DIR / "worktrees" / "thunes",
+    }
+)
+
+# Directory holding mcp-<name>-health scripts
+HEALTH_SCRIPT_DIR = LAB_DIR / "bin"
+
+# Optional aggregated checker that reports every server in one JSON object
+SWEEP_SCRIPT_NAME = "mcp-health-sweep"
+
+# Per-check timeout (seconds), shared by subprocess.run and the future guard
+HEALTH_CHECK_TIMEOUT = 5
+SWEEP_TIMEOUT = 15
+
+HEALTH_STATUSES = frozenset({"up", "down", "not_configured"})
+
+# status=/test_status= assignments in a bash-sourceable .worktree file
+WORKTREE_FIELD_PATTERN = re.compile(rb'^[ \t]*(status|test_status)=(.*?)[ \t\r]*$', re.M)
+
+
+def _scan_health_scripts() -> frozenset[str]:
+    """List installed health script names with a single directory read.
+
+    Returns:
+        Names of mcp-* files in HEALTH_SCRIPT_DIR (per-server scripts and the sweep)
+    """
+    try:
+        with os.scandir(HEALTH_SCRIPT_DIR) as entries:
+            return frozenset(entry.name for entry in entries if entry.name.startswith("mcp-"))
+    except OSError:
+        return frozenset()
+
+
+_INSTALLED_HEALTH_SCRIPTS = _scan_health_scripts()
+
+
+@cache
+def _health_script_path(server_name: str) -> Path | None:
+    """Resolve the health script for a server, cached for the process lifetime.
+
+    Args:
+        server_name: MCP server name (e.g., "rag-query")
+
+    Returns:
+        Path to the health script, or None if it is not installed
+    """
+    script_name = f"mcp-{server_name}-health"
+    if script_name not in _INSTALLED_HEALTH_SCRIPTS:
+        return None
+    return HEALTH_SCRIPT_DIR / script_name
 
 
 def check_mcp_health(server_name: str) -> str:
@@ -58,18 +116,18 @@ def check_mcp_health(server_name: str) -> str:
     Returns:
         Health status: "up", "down", or "not_configured"
     """
-    health_script = Path.home() / "LAB" / "bin" / f"mcp-{server_name}-health"
-
-    # Check if health script exists
-    if not health_script.exists():
+    health_script = _health_script_path(server_name)
+    if health_script is None:
         return "not_configured"
 
     # Run health check (exit code: 0=OK, 1=failed, 2=not configured)
     try:
+        # Only the exit code matters, so don't allocate pipes for output
         result = subprocess.run(
             [str(health_script)],
-            capture_output=True,
-            timeout=5,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=HEALTH_CHECK_TIMEOUT,
             check=False,
         )
         if result.returncode == 0:
@@ -82,6 +140,58 @@ def check_mcp_health(server_name: str) -> str:
         return "down"
 
 
+def sweep_mcp_health() -> dict[str, str] | None:
+    """Check all MCP servers with a single run of the sweep script.
+
+    The sweep script prints one JSON object mapping server name to status,
+    e.g. {"filesystem": "up", "fetch": "down"}.
+
+    Returns:
+        Mapping of server name to health status, or None if the sweep script
+        is not installed or did not produce usable output
+    """
+    if SWEEP_SCRIPT_NAME not in _INSTALLED_HEALTH_SCRIPTS:
+        return None
+
+    try:
+        result = subprocess.run(
+            [str(HEALTH_SCRIPT_DIR / SWEEP_SCRIPT_NAME)],
+            capture_output=True,
+            timeout=SWEEP_TIMEOUT,
+            check=False,
+        )
+        statuses = json.loads(result.stdout)
+    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
+        return None
+
+    if result.returncode != 0 or not isinstance(statuses, dict):
+        return None
+
+    # Servers missing from the sweep, or with unknown statuses, count as down
+    health = {}
+    for name in MCP_SERVERS:
+        status = statuses.get(name)
+        health[name] = status if status in HEALTH_STATUSES else "down"
+    return health
+
+
+def check_all_mcp_health() -> list[str]:
+    """Check every MCP server, preferring the sweep script over per-server checks.
+
+    Returns:
+        Health status for each entry in MCP_SERVERS, in order
+    """
+    swept = sweep_mcp_health()
+    if swept is not None:
+        return [swept[name] for name in MCP_SERVERS]
+
+    # Checks are independent and block on child processes, so run them concurrently.
+    # Each check is bounded by its own subprocess timeout (HEALTH_CHECK_TIMEOUT, then
+    # reported as down), so the whole sweep takes at most about that long
+    with ThreadPoolExecutor(max_workers=len(MCP_SERVERS)) as executor:
+        return list(executor.map(check_mcp_health, MCP_SERVERS))
+
+
 def read_worktree_metadata(worktree_path: Path) -> tuple[str, str]:
     """Read worktree metadata from .worktree file.
 
@@ -93,26 +203,19 @@ def read_worktree_metadata(worktree_path: Path) -> tuple[str, str]:
     """
     worktree_file = worktree_path / ".worktree"
 
-    # Default values if file doesn't exist
-    if not worktree_file.exists():
-        return ("working", "unknown")
-
-    # Read and parse .worktree file (bash-sourceable format)
-    status = "working"
-    test_status = "unknown"
+    # Default values if file doesn't exist or can't be read
+    fields = {b"status": "working", b"test_status": "unknown"}
 
+    # Read and parse .worktree file (bash-sourceable format) in one call
     try:
-        with open(worktree_file) as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("status="):
-                    status = line.split("=", 1)[1].strip('"')
-                elif line.startswith("test_status="):
-                    test_status = line.split("=", 1)[1].strip('"')
-    except Exception:
-        pass
+        data = worktree_file.read_bytes()
+    except OSError:
+        return (fields[b"status"], fields[b"test_status"])
 
-    return (status, test_status)
+    for match in WORKTREE_FIELD_PATTERN.finditer(data):
+        fields[match.group(1)] = match.group(2).strip(b'"').decode(errors="replace")
+
+    return (fields[b"status"], fields[b"test_status"])
 
 
 def update_all_metrics() -> None:
@@ -121,20 +224,26 @@ def update_all_metrics() -> None:
 
     # Update MCP server health
     print(f"\nChecking {len(MCP_SERVERS)} MCP servers:")
-    for server_name in MCP_SERVERS:
-        health = check_mcp_health(server_name)
-        prometheus_metrics.update_mcp_health(server_name, health)
+    results = check_all_mcp_health()
+
+    mcp_health = dict(zip(MCP_SERVERS, results, strict=True))
+    for server_name, health in mcp_health.items():
         symbol = "✓" if health == "up" else ("⚠" if health == "not_configured" else "✗")
         print(f"  {symbol} {server_name}: {health}")
 
-    # Update worktree status
+    # Read worktree status
     print(f"\nReading {len(WORKTREES)} worktree metadata:")
+    worktree_status = {}
+    worktree_test_status = {}
     for worktree_name, worktree_path in WORKTREES.items():
         status, test_status = read_worktree_metadata(worktree_path)
-        prometheus_metrics.update_worktree_status(worktree_name, status)
-        prometheus_metrics.update_worktree_test_status(worktree_name, test_status)
+        worktree_status[worktree_name] = status
+        worktree_test_status[worktree_name] = test_status
         print(f"  • {worktree_name}: status={status}, tests={test_status}")
 
+    # Publish everything in one sweep
+    prometheus_metrics.update_lab_metrics(mcp_health, worktree_status, worktree_test_status)
+
     print("\n✓ LAB metrics updated")
 
 
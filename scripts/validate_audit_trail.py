@@ -9,67 +9,141 @@ This script:
 """
 
 import json
+import mmap
 import sys
+from collections import Counter, deque
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 from src.config import settings
 from src.live.paper_trader import PaperTrader
+from src.utils.fast_json import loads
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def validate_jsonl_format(audit_file: Path) -> bool:
-    """Validate that audit trail is valid JSONL format.
+REQUIRED_FIELDS = frozenset({"timestamp", "event"})
+
+
+def _iter_lines(audit_file: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield raw lines of the audit trail without decoding them.
+
+    The file is memory-mapped and split on newline boundaries, so lines are
+    only copied out as bytes when consumed.
+
+    Args:
+        audit_file: Path to audit_trail.jsonl
+
+    Yields:
+        Tuples of (1-based line number, raw line bytes)
+    """
+    with open(audit_file, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; plain iteration handles them
+            yield from enumerate(f, start=1)
+            return
+
+        with mm:
+            size = len(mm)
+            start = 0
+            line_num = 0
+            while start < size:
+                newline = mm.find(b"\n", start)
+                end = size if newline == -1 else newline
+                line_num += 1
+                yield line_num, mm[start:end]
+                start = end + 1
+
+
+def analyze_audit_trail(
+    audit_file: Path,
+    sample: int = 3,
+    required_fields: frozenset[str] = REQUIRED_FIELDS,
+) -> tuple[bool, dict[str, int], list[dict[str, Any]]]:
+    """Validate, count events and collect recent entries in a single pass.
 
     Args:
         audit_file: Path to audit_trail.jsonl
+        sample: Number of most recent entries to return
+        required_fields: Fields every entry must contain
 
     Returns:
-        True if valid JSONL, False otherwise
+        Tuple of (valid, event_counts, tail_entries). Scanning stops at the
+        first invalid line.
     """
+    event_counts: Counter[str] = Counter()
+    tail: deque[dict[str, Any]] = deque(maxlen=sample)
+
     if not audit_file.exists():
         logger.error(f"Audit trail file not found: {audit_file}")
-        return False
+        return False, event_counts, []
 
     try:
-        with open(audit_file) as f:
-            for line_num, line in enumerate(f, start=1):
-                if line.strip():  # Skip empty lines
-                    try:
-                        json.loads(line)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Invalid JSON on line {line_num}: {e}")
-                        return False
-        logger.info("✅ Audit trail is valid JSONL format")
-        return True
-    except Exception as e:
+        for line_num, line in _iter_lines(audit_file):
+            if not line.strip():  # Skip empty lines
+                continue
+
+            try:
+                entry = loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON on line {line_num}: {e}")
+                return False, event_counts, list(tail)
+
+            if not isinstance(entry, dict):
+                logger.error(f"Line {line_num} is not a JSON object: {type(entry).__name__}")
+                return False, event_counts, list(tail)
+
+            missing_fields = required_fields - entry.keys()
+            if missing_fields:
+                logger.error(f"Line {line_num} missing required fields: {missing_fields}")
+                return False, event_counts, list(tail)
+
+            event_counts[entry.get("event", "UNKNOWN")] += 1
+            tail.append(entry)
+    except OSError as e:
         logger.error(f"Error reading audit trail: {e}")
-        return False
+        return False, event_counts, list(tail)
 
+    return True, event_counts, list(tail)
 
-def check_event_types(audit_file: Path) -> dict[str, int]:
-    """Count events by type.
+
+def _log_event_counts(event_counts: dict[str, int]) -> None:
+    """Log the event type distribution."""
+    logger.info("Event type distribution:")
+    for event, count in sorted(event_counts.items()):
+        logger.info(f"  {event}: {count}")
+
+
+def validate_jsonl_format(audit_file: Path) -> bool:
+    """Validate that audit trail is valid JSONL format.
 
     Args:
         audit_file: Path to audit_trail.jsonl
 
     Returns:
-        Dictionary mapping event type to count
+        True if valid JSONL, False otherwise
     """
-    event_counts: dict[str, int] = {}
+    valid, _, _ = analyze_audit_trail(audit_file, sample=0, required_fields=frozenset())
+    if valid:
+        logger.info("✅ Audit trail is valid JSONL format")
+    return valid
 
-    with open(audit_file) as f:
-        for line in f:
-            if line.strip():
-                entry = json.loads(line)
-                event = entry.get("event", "UNKNOWN")
-                event_counts[event] = event_counts.get(event, 0) + 1
 
-    logger.info("Event type distribution:")
-    for event, count in sorted(event_counts.items()):
-        logger.info(f"  {event}: {count}")
+def check_event_types(audit_file: Path) -> dict[str, int]:
+    """Count events by type.
+
+    Args:
+        audit_file: Path to audit_trail.jsonl
 
+    Returns:
+        Dictionary mapping event type to count
+    """
+    _, event_counts, _ = analyze_audit_trail(audit_file, sample=0, required_fields=frozenset())
+    _log_event_counts(event_counts)
     return event_counts
 
 
@@ -86,19 +160,10 @@ def verify_required_fields(audit_file: Path) -> bool:
     Returns:
         True if all entries have required fields
     """
-    required_fields = {"timestamp", "event"}
-
-    with open(audit_file) as f:
-        for line_num, line in enumerate(f, start=1):
-            if line.strip():
-                entry = json.loads(line)
-                missing_fields = required_fields - set(entry.keys())
-                if missing_fields:
-                    logger.error(f"Line {line_num} missing required fields: {missing_fields}")
-                    return False
-
-    logger.info("✅ All entries have required fields (timestamp, event)")
-    return True
+    valid, _, _ = analyze_audit_trail(audit_file, sample=0)
+    if valid:
+        logger.info("✅ All entries have required fields (timestamp, event)")
+    return valid
 
 
 def execute_sample_trades(trader: PaperTrader, num_trades: int = 3) -> None:
@@ -110,13 +175,15 @@ def execute_sample_trades(trader: PaperTrader, num_trades: int = 3) -> None:
     """
     logger.info(f"Executing {num_trades} sample trade attempts...")
 
+    symbol = settings.default_symbol
+    timeframe = settings.default_timeframe
     for i in range(num_trades):
         logger.info(f"Trade attempt {i+1}/{num_trades}")
         try:
             # Use smaller quote amount to pass risk check (MAX_LOSS_PER_TRADE=5.0)
             trader.run_strategy(
-                symbol=settings.default_symbol,
-                timeframe=settings.default_timeframe,
+                symbol=symbol,
+                timeframe=timeframe,
                 quote_amount=4.0,  # Below MAX_LOSS_PER_TRADE limit
             )
         except Exception as e:
@@ -135,8 +202,9 @@ def main() -> int:
     logger.info("=== Audit Trail Validation ===")
 
     # Initialize paper trader (testnet)
-    logger.info(f"Initializing PaperTrader (testnet={settings.environment != 'live'})")
-    trader = PaperTrader(testnet=(settings.environment != "live"))
+    testnet = settings.environment != "live"
+    logger.info(f"Initializing PaperTrader (testnet={testnet})")
+    trader = PaperTrader(testnet=testnet)
 
     # Execute sample trades to generate audit log
     execute_sample_trades(trader, num_trades=3)
@@ -144,18 +212,15 @@ def main() -> int:
     # Validate audit trail
     audit_file = Path("logs/audit_trail.jsonl")
 
-    # 1. Check JSONL format
-    if not validate_jsonl_format(audit_file):
-        logger.error("❌ JSONL format validation failed")
+    # Check JSONL format, required fields and event types in one pass
+    valid, event_counts, tail_entries = analyze_audit_trail(audit_file, sample=3)
+    if not valid:
+        logger.error("❌ Audit trail validation failed (format or required fields)")
         return 1
 
-    # 2. Verify required fields
-    if not verify_required_fields(audit_file):
-        logger.error("❌ Required fields validation failed")
-        return 1
-
-    # 3. Check event types
-    event_counts = check_event_types(audit_file)
+    logger.info("✅ Audit trail is valid JSONL format")
+    logger.info("✅ All entries have required fields (timestamp, event)")
+    _log_event_counts(event_counts)
 
     # Verify we have at least one entry
     if not event_counts:
@@ -171,18 +236,13 @@ def main() -> int:
 
     # Display sample entries
     logger.info("\n=== Sample Entries ===")
-    with open(audit_file) as f:
-        lines = f.readlines()
-        sample_size = min(3, len(lines))
-        for i, line in enumerate(lines[-sample_size:], start=1):
-            if line.strip():
-                entry = json.loads(line)
-                logger.info(f"\nEntry {i}:")
-                logger.info(f"  Event: {entry['event']}")
-                logger.info(f"  Timestamp: {entry['timestamp']}")
-                # Display all other fields (flat schema)
-                other_fields = {k: v for k, v in entry.items() if k not in ["event", "timestamp"]}
-                logger.info(f"  Fields: {json.dumps(other_fields, indent=4)}")
+    for i, entry in enumerate(tail_entries, start=1):
+        logger.info(f"\nEntry {i}:")
+        logger.info(f"  Event: {entry['event']}")
+        logger.info(f"  Timestamp: {entry['timestamp']}")
+        # Display all other fields (flat schema)
+        other_fields = {k: v for k, v in entry.items() if k not in ["event", "timestamp"]}
+        logger.info(f"  Fields: {json.dumps(other_fields, indent=4)}")
 
     logger.info("\n✅ Audit trail validation PASSED")
     return 0
@@ -118,9 +118,18 @@ def validate_binance():
     print("-" * 70)
 
     balances = account.get('balances', [])
+    balances_by_asset = {b['asset']: b for b in balances}
+    usdt = balances_by_asset.get('USDT')
+    usdt_balance = float(usdt['free']) if usdt else 0.0
+
+    # Convert each balance once: (asset, free, locked)
+    parsed_balances = [
+        (b['asset'], float(b.get('free', 0)), float(b.get('locked', 0))) for b in balances
+    ]
     non_zero_balances = [
-        b for b in balances
-        if float(b.get('free', 0)) + float(b.get('locked', 0)) > 0.001
+        (asset, free, locked)
+        for asset, free, locked in parsed_balances
+        if free + locked > 0.001
     ]
 
     print(f"Total assets: {len(balances)}")
@@ -133,17 +142,12 @@ def validate_binance():
         print("   Need at least 100 USDT for DR drill")
     else:
         print("Non-zero balances:")
-        for balance in non_zero_balances[:10]:  # Show first 10
-            asset = balance['asset']
-            free = float(balance['free'])
-            locked = float(balance['locked'])
+        for asset, free, locked in non_zero_balances[:10]:  # Show first 10
             total = free + locked
             print(f"  {asset}: {total:.8f} (free: {free:.8f}, locked: {locked:.8f})")
 
         # Check USDT specifically
-        usdt = next((b for b in balances if b['asset'] == 'USDT'), None)
         if usdt:
-            usdt_balance = float(usdt['free'])
             if usdt_balance < 100:
                 print()
                 print(f"⚠️  WARNING: USDT balance ({usdt_balance:.2f}) is low")
@@ -190,9 +194,6 @@ def validate_binance():
     print()
 
     if non_zero_balances:
-        usdt = next((b for b in balances if b['asset'] == 'USDT'), None)
-        usdt_balance = float(usdt['free']) if usdt else 0
-
         if usdt_balance >= 100:
             print("All checks passed! Binance testnet is ready for DR drill.")
         else:
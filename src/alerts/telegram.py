@@ -8,28 +8,107 @@ Implements async notifications for:
 """
 
 import asyncio
+import threading
+from collections.abc import Iterable
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from telegram import Bot
+from telegram.constants import MessageLimit
 from telegram.error import TelegramError
+from telegram.ext import AIORateLimiter, ExtBot
+from telegram.request import HTTPXRequest
 
 from src.config import settings
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Telegram allows ~30 msg/s per bot and 20 msg/min per group; stay under both
+RATE_LIMIT_OVERALL_PER_SECOND = 25
+RATE_LIMIT_GROUP_PER_MINUTE = 18
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+DATE_FORMAT = "%Y-%m-%d"
+
+# Silent alerts sent within this window (seconds) are merged into one message
+BATCH_WINDOW = 0.2
+BATCH_SEPARATOR = "\n\n---\n\n"
+
+# Upper bound on how long send_message_sync blocks the caller (seconds)
+SYNC_SEND_TIMEOUT = 30.0
+
+# Event loop shared by all synchronous sends. It runs for the life of the process
+# in a daemon thread, so each Bot keeps its HTTP connection pool (and TLS
+# sessions) between calls instead of rebuilding them on a fresh loop.
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever, name="telegram-loop", daemon=True
+            ).start()
+        return _background_loop
+
 
 class TelegramBot:
     """Async Telegram bot for trading alerts.
 
     Attributes:
-        bot: Telegram Bot instance
+        bot: Telegram ExtBot instance (rate limited)
         chat_id: Target chat ID for notifications
         enabled: Whether notifications are enabled
     """
 
+    # Alert message templates (Markdown), filled with str.format
+    _KILL_SWITCH_TEMPLATE = (
+        "🚨 *KILL-SWITCH TRIGGERED* 🚨\n\n"
+        "*Daily Loss Limit Exceeded*\n"
+        "Current Loss: `{daily_loss:.2f} USDT`\n"
+        "Limit: `{limit:.2f} USDT`\n\n"
+        "⛔ *TRADING HALTED* ⛔\n"
+        "Time: `{time}`\n\n"
+        "Action Required: Review logs and adjust strategy parameters"
+    )
+    _DECAY_TEMPLATE = (
+        "{emoji} *PARAMETER DECAY: {severity}* {emoji}\n\n"
+        "*Strategy Performance Degrading*\n"
+        "Current Sharpe: `{current_sharpe:.4f}`\n"
+        "Threshold: `{threshold:.4f}`\n\n"
+        "{action}\n"
+        "Time: `{time}`"
+    )
+    _REOPTIMIZATION_TEMPLATE = (
+        "✅ *RE-OPTIMIZATION COMPLETE*\n\n"
+        "*New Parameters Loaded*\n"
+        "Strategy: `{strategy}`\n"
+        "Improvement: `{improvement:+.2f}%`\n\n"
+        "*Parameter Changes:*\n"
+    )
+    _PARAMETER_CHANGE_LINE = "• {key}: `{old}` → `{new}`\n"
+    _DAILY_SUMMARY_TEMPLATE = (
+        "{emoji} *DAILY SUMMARY*\n\n"
+        "*Performance (24h)*\n"
+        "Total PnL: `{total_pnl:+.2f} USDT`\n"
+        "Win Rate: `{win_rate:.1f}%`\n"
+        "Sharpe Ratio: `{sharpe:.4f}`\n\n"
+        "*Trade Statistics*\n"
+        "Total Trades: `{total_trades}`\n"
+        "Profitable: `{profitable_trades}` ({win_rate:.1f}%)\n"
+        "Losing: `{losing_trades}`\n\n"
+        "Date: `{date}`"
+    )
+    _CUSTOM_TITLE = "*{title}*\n\n"
+    _DETAIL_LINE = "• {key}: `{value}`\n"
+    _TIME_FOOTER = "\nTime: `{time}`"
+
     def __init__(self, token: str | None = None, chat_id: str | None = None) -> None:
         """Initialize Telegram bot.
 
@@ -43,17 +122,56 @@ class TelegramBot:
         # Check if Telegram is properly configured
         self.enabled = bool(self.token and self.chat_id)
 
+        # Silent alerts waiting to be batched, per event loop, and their flush tasks
+        self._pending: dict[asyncio.AbstractEventLoop, list[tuple[str, asyncio.Future[bool]]]] = {}
+        self._flush_tasks: dict[asyncio.AbstractEventLoop, asyncio.Task[None]] = {}
+
         if self.enabled:
-            self.bot = Bot(token=self.token)
+            # Size the pool for bursts of concurrent alerts so sends don't queue
+            # behind an exhausted pool
+            request = HTTPXRequest(
+                connection_pool_size=settings.telegram_pool_size,
+                pool_timeout=settings.telegram_pool_timeout,
+                connect_timeout=5.0,
+                read_timeout=10.0,
+            )
+            self.bot = ExtBot(
+                token=self.token, request=request, rate_limiter=self._create_rate_limiter()
+            )
             logger.info(f"TelegramBot initialized (chat_id={self.chat_id})")
         else:
             logger.warning("TelegramBot disabled: Missing token or chat_id")
 
+    @staticmethod
+    def _create_rate_limiter() -> AIORateLimiter | None:
+        """Build the rate limiter that paces sends and retries on RetryAfter.
+
+        Returns:
+            AIORateLimiter, or None if the rate-limiter extra is not installed
+        """
+        try:
+            return AIORateLimiter(
+                overall_max_rate=RATE_LIMIT_OVERALL_PER_SECOND,
+                overall_time_period=1,
+                group_max_rate=RATE_LIMIT_GROUP_PER_MINUTE,
+                group_time_period=60,
+            )
+        except RuntimeError:
+            logger.warning(
+                "AIORateLimiter unavailable (install python-telegram-bot[rate-limiter]); "
+                "sending without rate limiting"
+            )
+            return None
+
     async def send_message(
         self, message: str, parse_mode: str = "Markdown", disable_notification: bool = False
     ) -> bool:
         """Send message to configured chat.
 
+        Silent Markdown messages are held for BATCH_WINDOW seconds and sent
+        together with any others that arrive meanwhile. Messages that notify
+        are sent immediately.
+
         Args:
             message: Message text (supports Markdown)
             parse_mode: Telegram parse mode (Markdown or HTML)
@@ -66,6 +184,34 @@ class TelegramBot:
             logger.debug(f"Telegram disabled, would send: {message}")
             return False
 
+        if disable_notification and parse_mode == "Markdown":
+            return await self._enqueue(message)
+
+        return await self._send_now(message, parse_mode, disable_notification)
+
+    async def send_many(self, messages: Iterable[tuple[str, bool]]) -> list[bool]:
+        """Send several messages concurrently.
+
+        Sends overlap on the network while the rate limiter keeps pacing
+        within Telegram's limits; silent messages still go through batching.
+
+        Args:
+            messages: (message, disable_notification) pairs, sent as Markdown
+
+        Returns:
+            Per-message send results, in input order
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.send_message(message, disable_notification=silent)
+                    for message, silent in messages
+                )
+            )
+        )
+
+    async def _send_now(self, message: str, parse_mode: str, disable_notification: bool) -> bool:
+        """Send a single Telegram message without batching."""
         try:
             await self.bot.send_message(
                 chat_id=self.chat_id,
@@ -79,6 +225,82 @@ class TelegramBot:
             logger.error(f"Failed to send Telegram message: {e}")
             return False
 
+    async def _enqueue(self, message: str) -> bool:
+        """Queue a silent message for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+        self._pending.setdefault(loop, []).append((message, future))
+
+        if loop not in self._flush_tasks:
+            self._flush_tasks[loop] = loop.create_task(self._flush_after(loop, BATCH_WINDOW))
+
+        return await future
+
+    async def _flush_after(self, loop: asyncio.AbstractEventLoop, delay: float) -> None:
+        """Wait for the batch window, then send everything queued on this loop."""
+        await asyncio.sleep(delay)
+        del self._flush_tasks[loop]
+        pending = self._pending.pop(loop, [])
+
+        for text, items in self._build_batches(pending):
+            if len(items) > 1:
+                try:
+                    sent = await self._send_now(text, "Markdown", True)
+                except Exception as e:
+                    logger.warning(f"Batched Telegram send raised: {e}")
+                    sent = False
+                if sent:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_result(True)
+                    continue
+                # One message with broken Markdown makes Telegram reject the whole
+                # batch, so resend individually and give each caller its own result
+                logger.warning(f"Batched send failed, resending {len(items)} messages one by one")
+
+            for message, future in items:
+                await self._send_to_future(message, future)
+
+    async def _send_to_future(self, message: str, future: asyncio.Future[bool]) -> None:
+        """Send one silent message and resolve its caller's future with the outcome."""
+        try:
+            result = await self._send_now(message, "Markdown", True)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _build_batches(
+        pending: list[tuple[str, asyncio.Future[bool]]],
+    ) -> list[tuple[str, list[tuple[str, asyncio.Future[bool]]]]]:
+        """Join queued messages into as few texts as fit Telegram's length limit.
+
+        Args:
+            pending: Queued (message, future) pairs in arrival order
+
+        Returns:
+            List of (joined text, (message, future) pairs it contains)
+        """
+        batches: list[tuple[str, list[tuple[str, asyncio.Future[bool]]]]] = []
+        text = ""
+        items: list[tuple[str, asyncio.Future[bool]]] = []
+
+        for message, future in pending:
+            candidate = f"{text}{BATCH_SEPARATOR}{message}" if text else message
+            if text and len(candidate) > MessageLimit.MAX_TEXT_LENGTH:
+                batches.append((text, items))
+                text, items = message, [(message, future)]
+            else:
+                text = candidate
+                items.append((message, future))
+
+        if items:
+            batches.append((text, items))
+        return batches
+
     async def send_kill_switch_alert(self, daily_loss: Decimal, limit: Decimal) -> bool:
         """Send kill-switch trigger notification.
 
@@ -89,14 +311,12 @@ class TelegramBot:
         Returns:
             True if sent successfully
         """
-        message = (
-            "🚨 *KILL-SWITCH TRIGGERED* 🚨\n\n"
-            f"*Daily Loss Limit Exceeded*\n"
-            f"Current Loss: `{daily_loss:.2f} USDT`\n"
-            f"Limit: `{limit:.2f} USDT`\n\n"
-            f"⛔ *TRADING HALTED* ⛔\n"
-            f"Time: `{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}`\n\n"
-            f"Action Required: Review logs and adjust strategy parameters"
+        if not self.enabled:
+            logger.debug("Telegram disabled, skipping kill-switch alert")
+            return False
+
+        message = self._KILL_SWITCH_TEMPLATE.format(
+            daily_loss=daily_loss, limit=limit, time=self._timestamp()
         )
         return await self.send_message(message, disable_notification=False)
 
@@ -116,16 +336,22 @@ class TelegramBot:
         Returns:
             True if sent successfully
         """
-        emoji = "⚠️" if severity == "WARNING" else "🚨"
-        message = (
-            f"{emoji} *PARAMETER DECAY: {severity}* {emoji}\n\n"
-            f"*Strategy Performance Degrading*\n"
-            f"Current Sharpe: `{current_sharpe:.4f}`\n"
-            f"Threshold: `{threshold:.4f}`\n\n"
-            f"{'⏳ Re-optimization recommended' if severity == 'WARNING' else '🔴 Re-optimization REQUIRED'}\n"
-            f"Time: `{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}`"
+        if not self.enabled:
+            logger.debug("Telegram disabled, skipping parameter decay warning")
+            return False
+
+        is_warning = severity == "WARNING"
+        message = self._DECAY_TEMPLATE.format(
+            emoji="⚠️" if is_warning else "🚨",
+            severity=severity,
+            current_sharpe=current_sharpe,
+            threshold=threshold,
+            action=(
+                "⏳ Re-optimization recommended" if is_warning else "🔴 Re-optimization REQUIRED"
+            ),
+            time=self._timestamp(),
         )
-        return await self.send_message(message, disable_notification=(severity == "WARNING"))
+        return await self.send_message(message, disable_notification=is_warning)
 
     async def send_reoptimization_complete(
         self,
@@ -143,25 +369,26 @@ class TelegramBot:
         Returns:
             True if sent successfully
         """
-        message = (
-            "✅ *RE-OPTIMIZATION COMPLETE*\n\n"
-            f"*New Parameters Loaded*\n"
-            f"Strategy: `{new_params.get('strategy', 'Unknown')}`\n"
-            f"Improvement: `{improvement:+.2f}%`\n\n"
-            f"*Parameter Changes:*\n"
-        )
+        if not self.enabled:
+            logger.debug("Telegram disabled, skipping re-optimization alert")
+            return False
 
         # Compare old vs new parameters
         old_p = old_params.get("parameters", {})
         new_p = new_params.get("parameters", {})
 
-        for key in sorted(new_p.keys()):
-            old_val = old_p.get(key, "N/A")
-            new_val = new_p[key]
-            message += f"• {key}: `{old_val}` → `{new_val}`\n"
-
-        message += f"\nTime: `{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}`"
-
+        message = (
+            self._REOPTIMIZATION_TEMPLATE.format(
+                strategy=new_params.get("strategy", "Unknown"), improvement=improvement
+            )
+            + "".join(
+                self._PARAMETER_CHANGE_LINE.format(
+                    key=key, old=old_p.get(key, "N/A"), new=new_p[key]
+                )
+                for key in sorted(new_p)
+            )
+            + self._TIME_FOOTER.format(time=self._timestamp())
+        )
         return await self.send_message(message, disable_notification=True)
 
     async def send_daily_summary(
@@ -184,18 +411,19 @@ class TelegramBot:
         Returns:
             True if sent successfully
         """
-        emoji = "📈" if total_pnl > 0 else "📉" if total_pnl < 0 else "➖"
-        message = (
-            f"{emoji} *DAILY SUMMARY*\n\n"
-            f"*Performance (24h)*\n"
-            f"Total PnL: `{total_pnl:+.2f} USDT`\n"
-            f"Win Rate: `{win_rate:.1f}%`\n"
-            f"Sharpe Ratio: `{sharpe:.4f}`\n\n"
-            f"*Trade Statistics*\n"
-            f"Total Trades: `{total_trades}`\n"
-            f"Profitable: `{profitable_trades}` ({win_rate:.1f}%)\n"
-            f"Losing: `{total_trades - profitable_trades}`\n\n"
-            f"Date: `{datetime.now().strftime('%Y-%m-%d')}`"
+        if not self.enabled:
+            logger.debug("Telegram disabled, skipping daily summary")
+            return False
+
+        message = self._DAILY_SUMMARY_TEMPLATE.format(
+            emoji="📈" if total_pnl > 0 else "📉" if total_pnl < 0 else "➖",
+            total_pnl=total_pnl,
+            win_rate=win_rate,
+            sharpe=sharpe,
+            total_trades=total_trades,
+            profitable_trades=profitable_trades,
+            losing_trades=total_trades - profitable_trades,
+            date=self._timestamp(DATE_FORMAT),
         )
         return await self.send_message(message, disable_notification=True)
 
@@ -209,13 +437,24 @@ class TelegramBot:
         Returns:
             True if sent successfully
         """
-        message = f"*{title}*\n\n"
-        for key, value in details.items():
-            message += f"• {key}: `{value}`\n"
-        message += f"\nTime: `{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}`"
+        if not self.enabled:
+            logger.debug("Telegram disabled, skipping custom alert")
+            return False
 
+        message = (
+            self._CUSTOM_TITLE.format(title=title)
+            + "".join(
+                self._DETAIL_LINE.format(key=key, value=value) for key, value in details.items()
+            )
+            + self._TIME_FOOTER.format(time=self._timestamp())
+        )
         return await self.send_message(message, disable_notification=True)
 
+    @staticmethod
+    def _timestamp(fmt: str = TIMESTAMP_FORMAT) -> str:
+        """Format the current local time for alert messages."""
+        return datetime.now().strftime(fmt)
+
     def send_message_sync(self, message: str) -> bool:
         """Synchronous wrapper for send_message (for non-async contexts).
 
@@ -225,25 +464,42 @@ class TelegramBot:
         Returns:
             True if sent successfully
         """
+        future = asyncio.run_coroutine_threadsafe(
+            self.send_message(message), _get_background_loop()
+        )
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            return future.result(timeout=SYNC_SEND_TIMEOUT)
+        except FutureTimeoutError:
+            future.cancel()
+            logger.error(f"Telegram message not sent within {SYNC_SEND_TIMEOUT:.0f}s")
+            return False
+
+
+# Convenience function for quick alerts.
+# Bot used by send_alert when no instance is given. Created on first use and then
+# reused, so every convenience alert shares one HTTP client and connection pool.
+_default_bot: TelegramBot | None = None
+_default_bot_lock = threading.Lock()
+
 
-        return loop.run_until_complete(self.send_message(message))
+def _get_default_bot() -> TelegramBot:
+    """Return the shared default TelegramBot, creating it on first use."""
+    global _default_bot
+    with _default_bot_lock:
+        if _default_bot is None:
+            _default_bot = TelegramBot()
+        return _default_bot
 
 
-# Convenience function for quick alerts
 def send_alert(message: str, bot_instance: TelegramBot | None = None) -> bool:
     """Send quick alert using default or provided bot instance.
 
     Args:
         message: Message to send
-        bot_instance: Optional bot instance (creates new one if None)
+        bot_instance: Optional bot instance (uses a shared default bot if None)
 
     Returns:
         True if sent successfully
     """
-    bot = bot_instance or TelegramBot()
+    bot = bot_instance or _get_default_bot()
     return bot.send_message_sync(message)
@@ -0,0 +1,214 @@
+"""Numba-compiled kernels for strategy signal generation.
+
+Each kernel walks its input once and reproduces the vectorbt/pandas pipeline it
+replaces (same window definitions and NaN placement), so signals are unchanged.
+numba is always available here since vectorbt depends on it.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+# fastmath is left off since it assumes no NaNs, and NaN placement is part of the
+# contract; the numpy error model turns x/0 into inf/NaN instead of raising
+@njit(cache=True, error_model="numpy")
+def rsi_kernel(close: np.ndarray, period: int) -> np.ndarray:
+    """Relative Strength Index in a single pass, matching ``vbt.RSI.run(close, window=period)``.
+
+    Gains and losses are averaged with a simple trailing mean of ``period``
+    bars (vectorbt's default, not Wilder smoothing). Window sums are taken as
+    differences of running totals, exactly as vectorbt's rolling mean does, so
+    results agree bit for bit.
+
+    Args:
+        close: Close prices (float64), may contain NaN
+        period: RSI window
+
+    Returns:
+        RSI values, NaN wherever the window holds a missing price change
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+
+    # Running totals as of ``period`` bars ago, indexed by i % period
+    up_hist = np.zeros(period)
+    down_hist = np.zeros(period)
+    nan_hist = np.zeros(period, dtype=np.int64)
+
+    up_total = 0.0
+    down_total = 0.0
+    nan_total = 0
+
+    for i in range(n):
+        delta = close[i] - close[i - 1] if i > 0 else np.nan
+        if math.isnan(delta):
+            nan_total += 1
+        elif delta > 0.0:
+            up_total += delta
+        elif delta < 0.0:
+            down_total -= delta
+
+        slot = i % period
+        if i < period:
+            valid = i + 1 - nan_total
+            up_sum = up_total
+            down_sum = down_total
+        else:
+            valid = period - (nan_total - nan_hist[slot])
+            up_sum = up_total - up_hist[slot]
+            down_sum = down_total - down_hist[slot]
+        up_hist[slot] = up_total
+        down_hist[slot] = down_total
+        nan_hist[slot] = nan_total
+
+        if valid >= period:
+            rs = (up_sum / valid) / (down_sum / valid)
+            out[i] = 100.0 - 100.0 / (1.0 + rs)
+
+    return out
+
+
+@njit(cache=True, error_model="numpy")
+def stop_loss_kernel(close: np.ndarray, entries: np.ndarray, stop_loss_pct: float) -> np.ndarray:
+    """Stop-loss exits in a single pass.
+
+    Tracks the close of the most recent entry bar (bars with a NaN close keep
+    the previous entry price) and flags every bar whose drop from it exceeds
+    ``stop_loss_pct`` percent. The flag stays raised on each bar the drop
+    persists, until a new entry resets the reference price.
+
+    Args:
+        close: Close prices (float64)
+        entries: Entry signals (bool)
+        stop_loss_pct: Stop-loss percentage threshold
+
+    Returns:
+        Boolean array of stop-loss exits
+    """
+    n = close.shape[0]
+    out = np.zeros(n, dtype=np.bool_)
+    entry_price = np.nan
+
+    for i in range(n):
+        if entries[i] and not math.isnan(close[i]):
+            entry_price = close[i]
+        # NaN before the first entry compares False
+        out[i] = ((close[i] - entry_price) / entry_price) * 100 < -stop_loss_pct
+
+    return out
+
+
+@njit(cache=True, error_model="numpy")
+def rsi_signals_kernel(
+    rsi: np.ndarray,
+    close: np.ndarray,
+    oversold: float,
+    overbought: float,
+    stop_loss_pct: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """RSI strategy entries and exits in a single pass.
+
+    Fuses the oversold/overbought crossings and ``stop_loss_kernel`` into one
+    walk, carrying the previous RSI and the entry price as scalars. Results
+    equal the separate passes OR-ed together.
+
+    Args:
+        rsi: RSI values (float64), NaN where undefined
+        close: Close prices (float64), unshifted
+        oversold: Entry threshold (RSI crosses below)
+        overbought: Exit threshold (RSI crosses above)
+        stop_loss_pct: Stop-loss percentage threshold
+
+    Returns:
+        Tuple of (entries, exits) boolean arrays
+    """
+    n = rsi.shape[0]
+    entries = np.zeros(n, dtype=np.bool_)
+    exits = np.zeros(n, dtype=np.bool_)
+    prev = np.nan  # The first bar is never a crossing
+    entry_price = np.nan
+
+    for i in range(n):
+        now = rsi[i]
+        entry = now < oversold and prev >= oversold
+        if entry and not math.isnan(close[i]):
+            entry_price = close[i]
+        entries[i] = entry
+        exits[i] = (now > overbought and prev <= overbought) or (
+            ((close[i] - entry_price) / entry_price) * 100 < -stop_loss_pct
+        )
+        prev = now
+
+    return entries, exits
+
+
+@njit(cache=True, parallel=True, error_model="numpy")
+def simulate_rsi_grid_kernel(
+    close: np.ndarray,
+    rsi: np.ndarray,
+    period_idx: np.ndarray,
+    oversold: np.ndarray,
+    overbought: np.ndarray,
+    stop_loss_pct: np.ndarray,
+    init_cash: float,
+    fees: float,
+    slippage: float,
+) -> np.ndarray:
+    """Total return of the RSI strategy for many parameter sets, in parallel.
+
+    Each configuration generates the same signals as ``RSIStrategy.generate_signals``
+    and runs them through a long-only, all-in simulator equivalent to
+    ``vbt.Portfolio.from_signals`` defaults: fills at close adjusted by
+    ``slippage``, ``fees`` charged on traded value, and bars with both an entry
+    and an exit signal ignored.
+
+    Args:
+        close: Close prices (float64, no NaN)
+        rsi: T x P matrix of RSI values for each candidate period
+        period_idx: Column of ``rsi`` used by each configuration
+        oversold: Oversold threshold per configuration
+        overbought: Overbought threshold per configuration
+        stop_loss_pct: Stop-loss percentage per configuration
+        init_cash: Starting capital
+        fees: Fee fraction per fill
+        slippage: Slippage fraction per fill
+
+    Returns:
+        Total return (fraction) per configuration
+    """
+    n = close.shape[0]
+    n_configs = period_idx.shape[0]
+    out = np.empty(n_configs)
+
+    for k in prange(n_configs):
+        col = period_idx[k]
+        cash = init_cash
+        size = 0.0
+        entry_price = np.nan
+
+        for i in range(1, n):
+            now = rsi[i, col]
+            prev = rsi[i - 1, col]
+            entry = now < oversold[k] and prev >= oversold[k]
+            exit_overbought = now > overbought[k] and prev <= overbought[k]
+
+            if entry:
+                entry_price = close[i]
+            exit_stoploss = ((close[i] - entry_price) / entry_price) * 100 < -stop_loss_pct[k]
+
+            if entry and (exit_overbought or exit_stoploss):
+                continue
+            if entry and size == 0.0:
+                price = close[i] * (1.0 + slippage)
+                size = cash / (price * (1.0 + fees))
+                cash = 0.0
+            elif (exit_overbought or exit_stoploss) and size > 0.0:
+                price = close[i] * (1.0 - slippage)
+                cash += size * price * (1.0 - fees)
+                size = 0.0
+
+        out[k] = (cash + size * close[n - 1]) / init_cash - 1.0 if n > 0 else 0.0
+
+    return out
@@ -1,12 +1,129 @@
 """RSI Mean Reversion Trading Strategy."""
 
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
 import pandas as pd
 import vectorbt as vbt
 
+from src.backtest._signal_kernels import (
+    rsi_kernel,
+    rsi_signals_kernel,
+    simulate_rsi_grid_kernel,
+    stop_loss_kernel,
+)
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# RSI arrays keyed by (close-price digest, period). Parameter sweeps that vary only
+# thresholds or stop-loss on the same data reuse one RSI computation.
+RSI_CACHE_SIZE = 32
+_rsi_cache: OrderedDict[tuple[bytes, int], np.ndarray] = OrderedDict()
+_rsi_cache_lock = threading.Lock()
+
+
+def _cached_rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """Return the RSI of ``close``, computing it only on a cache miss.
+
+    Args:
+        close: Close prices (float64)
+        period: RSI period
+
+    Returns:
+        Read-only RSI array aligned with ``close``
+    """
+    key = (hashlib.blake2b(close.tobytes(), digest_size=16).digest(), period)
+
+    with _rsi_cache_lock:
+        rsi = _rsi_cache.get(key)
+        if rsi is not None:
+            _rsi_cache.move_to_end(key)
+            return rsi
+
+    rsi = rsi_kernel(close, period)
+    rsi.flags.writeable = False
+
+    with _rsi_cache_lock:
+        _rsi_cache[key] = rsi
+        if len(_rsi_cache) > RSI_CACHE_SIZE:
+            _rsi_cache.popitem(last=False)
+    return rsi
+
+
+def _shift_one(values: np.ndarray) -> np.ndarray:
+    """Shift an array one bar forward along axis 0, like ``shift(1)``, with NaN first."""
+    shifted = np.empty_like(values)
+    shifted[:1] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+@dataclass
+class RSIState:
+    """Streaming state for ``RSIStrategy.update``.
+
+    Mirrors the running totals of ``rsi_kernel`` so incremental RSI values
+    match the batch computation exactly.
+    """
+
+    period: int
+    bars: int = 0
+    prev_close: float = np.nan  # Close of the previous bar
+    prev_shifted: float = np.nan  # Close two bars back (previous shifted value)
+    prev_rsi: float = np.nan
+    entry_price: float = np.nan
+    up_total: float = 0.0
+    down_total: float = 0.0
+    nan_total: int = 0
+    up_hist: list[float] = field(default_factory=list)
+    down_hist: list[float] = field(default_factory=list)
+    nan_hist: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.up_hist = [0.0] * self.period
+        self.down_hist = [0.0] * self.period
+        self.nan_hist = [0] * self.period
+
+    def push_rsi(self, shifted_close: float) -> float:
+        """Add the next shifted close and return the RSI for that bar."""
+        i = self.bars
+        delta = shifted_close - self.prev_shifted
+        if delta != delta:  # NaN
+            self.nan_total += 1
+        elif delta > 0.0:
+            self.up_total += delta
+        elif delta < 0.0:
+            self.down_total -= delta
+
+        slot = i % self.period
+        if i < self.period:
+            valid = i + 1 - self.nan_total
+            up_sum = self.up_total
+            down_sum = self.down_total
+        else:
+            valid = self.period - (self.nan_total - self.nan_hist[slot])
+            up_sum = self.up_total - self.up_hist[slot]
+            down_sum = self.down_total - self.down_hist[slot]
+        self.up_hist[slot] = self.up_total
+        self.down_hist[slot] = self.down_total
+        self.nan_hist[slot] = self.nan_total
+        self.prev_shifted = shifted_close
+
+        if valid < self.period:
+            return np.nan
+        avg_up = up_sum / valid
+        avg_down = down_sum / valid
+        if avg_down == 0.0:
+            # x/0 is inf (RSI 100) and 0/0 is NaN, as in the compiled kernel
+            return np.nan if avg_up == 0.0 else 100.0
+        return 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+
 
 class RSIStrategy:
     """
@@ -39,6 +156,7 @@ class RSIStrategy:
         self.oversold_threshold = oversold_threshold
         self.overbought_threshold = overbought_threshold
         self.stop_loss_pct = stop_loss_pct
+        self._state: RSIState | None = None
 
         logger.info(
             f"RSI Strategy initialized: period={rsi_period}, "
@@ -62,34 +180,197 @@ class RSIStrategy:
         """
         # Shift close prices to prevent look-ahead bias
         # Signal at bar i uses only data through bar i-1
-        close = df["close"].shift(1)
+        close = _shift_one(df["close"].to_numpy(dtype=np.float64))
+
+        # Calculate RSI (compiled kernel, cached across calls on the same prices)
+        rsi = _cached_rsi(close, self.rsi_period)
+
+        # Entry: RSI crosses below oversold threshold (crossing, not level, so a
+        # long oversold stretch gives one entry). Exit: RSI crosses above
+        # overbought or price drops stop_loss_pct% from entry. One fused pass.
+        entries, exits = rsi_signals_kernel(
+            rsi,
+            df["close"].to_numpy(dtype=np.float64),
+            self.oversold_threshold,
+            self.overbought_threshold,
+            self.stop_loss_pct,
+        )
+        entries = pd.Series(entries, index=df.index, copy=False)
+        exits = pd.Series(exits, index=df.index, copy=False)
+
+        logger.debug(f"Generated {entries.sum()} entry signals, {exits.sum()} exit signals")
+
+        return entries, exits
+
+    def update(self, close: float) -> tuple[bool, bool]:
+        """
+        Process one new bar and return its signals in O(1).
+
+        Equivalent to the last row of ``generate_signals`` on the full history
+        fed so far, without recomputing it. Call ``reset`` to start a new series.
+
+        Args:
+            close: Close price of the new bar
+
+        Returns:
+            Tuple of (entry_signal, exit_signal) for this bar
+        """
+        if self._state is None:
+            self._state = RSIState(self.rsi_period)
+        state = self._state
+
+        # The RSI for this bar uses closes through the previous bar (no look-ahead)
+        rsi = state.push_rsi(state.prev_close)
+        prev_rsi = state.prev_rsi
+
+        entry = rsi < self.oversold_threshold and prev_rsi >= self.oversold_threshold
+        exit_overbought = rsi > self.overbought_threshold and prev_rsi <= self.overbought_threshold
+
+        if entry and close == close:
+            state.entry_price = close
+        exit_stoploss = ((close - state.entry_price) / state.entry_price) * 100 < (
+            -self.stop_loss_pct
+        )
+
+        state.prev_rsi = rsi
+        state.prev_close = close
+        state.bars += 1
+
+        return entry, exit_overbought or exit_stoploss
 
-        # Calculate RSI using vectorbt
-        rsi_indicator = vbt.RSI.run(close, window=self.rsi_period, short_name="rsi")
-        rsi = rsi_indicator.rsi
+    def reset(self) -> None:
+        """Discard the streaming state used by ``update``."""
+        self._state = None
 
-        # Entry: RSI crosses below oversold threshold
-        # Use crossing logic to avoid staying in oversold too long
-        entries = (rsi < self.oversold_threshold) & (rsi.shift(1) >= self.oversold_threshold)
+    def generate_signals_grid(
+        self,
+        df: pd.DataFrame,
+        periods: Sequence[int],
+        oversold_thresholds: Sequence[float],
+        overbought_thresholds: Sequence[float],
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Generate signals for every parameter combination in one broadcast pass.
 
-        # Exit: RSI crosses above overbought threshold
-        exits_overbought = (rsi > self.overbought_threshold) & (
-            rsi.shift(1) <= self.overbought_threshold
+        Each column equals ``generate_signals`` for a strategy with that
+        (period, oversold, overbought) combination and this strategy's
+        stop-loss. The result can be passed straight to
+        ``vbt.Portfolio.from_signals`` to backtest the whole grid at once.
+
+        Args:
+            df: DataFrame with OHLCV data
+            periods: RSI periods to evaluate
+            oversold_thresholds: Oversold entry thresholds to evaluate
+            overbought_thresholds: Overbought exit thresholds to evaluate
+
+        Returns:
+            Tuple of (entry_signals, exit_signals) as boolean DataFrames with
+            (rsi_period, oversold_threshold, overbought_threshold) column levels
+        """
+        close_values = df["close"].to_numpy(dtype=np.float64)
+        close = _shift_one(close_values)
+        oversold = np.asarray(oversold_thresholds, dtype=np.float64)
+        overbought = np.asarray(overbought_thresholds, dtype=np.float64)
+
+        # T x P matrix of RSI values and the same shifted by one bar
+        rsi = np.column_stack([_cached_rsi(close, period) for period in periods])
+        prev_rsi = _shift_one(rsi)
+
+        # Crossings broadcast over thresholds: T x P x O and T x P x B
+        entries = (rsi[:, :, None] < oversold) & (prev_rsi[:, :, None] >= oversold)
+        exits_overbought = (rsi[:, :, None] > overbought) & (prev_rsi[:, :, None] <= overbought)
+
+        # Stop-loss depends only on the entries, so once per (period, oversold) pair
+        exits_stoploss = np.empty_like(entries)
+        for p in range(entries.shape[1]):
+            for o in range(entries.shape[2]):
+                exits_stoploss[:, p, o] = stop_loss_kernel(
+                    close_values, entries[:, p, o], self.stop_loss_pct
+                )
+
+        # T x P x O x B, flattened in the same order as the column product
+        shape = (len(df), len(periods), len(oversold), len(overbought))
+        grid_entries = np.broadcast_to(entries[:, :, :, None], shape).reshape(len(df), -1)
+        grid_exits = (exits_overbought[:, :, None, :] | exits_stoploss[:, :, :, None]).reshape(
+            len(df), -1
         )
 
-        # Exit: Stop-loss triggered (price drops stop_loss_pct% from entry)
-        exits_stoploss = self._calculate_stop_loss(df, entries, self.stop_loss_pct)
+        columns = pd.MultiIndex.from_product(
+            [list(periods), oversold.tolist(), overbought.tolist()],
+            names=["rsi_period", "oversold_threshold", "overbought_threshold"],
+        )
+        logger.debug(f"Generated signals for {len(columns)} RSI parameter combinations")
+
+        return (
+            pd.DataFrame(grid_entries, index=df.index, columns=columns, copy=False),
+            pd.DataFrame(grid_exits, index=df.index, columns=columns, copy=False),
+        )
+
+    @staticmethod
+    def sweep_total_returns(
+        df: pd.DataFrame,
+        periods: Sequence[int],
+        oversold_thresholds: Sequence[float],
+        overbought_thresholds: Sequence[float],
+        stop_loss_pcts: Sequence[float],
+        initial_capital: float = 10000.0,
+        fees: float = 0.001,
+        slippage: float = 0.0005,
+    ) -> pd.Series:
+        """
+        Total return of every parameter combination, simulated in parallel.
+
+        Runs a compiled long-only simulator across all combinations on every
+        core, matching ``backtest(...).total_return()`` for each. Use it to
+        rank a grid, then call ``backtest`` on the winner for full statistics.
 
-        # Combine exit conditions
-        exits = exits_overbought | exits_stoploss
+        Args:
+            df: DataFrame with OHLCV data (close must not contain NaN)
+            periods: RSI periods to evaluate
+            oversold_thresholds: Oversold entry thresholds to evaluate
+            overbought_thresholds: Overbought exit thresholds to evaluate
+            stop_loss_pcts: Stop-loss percentages to evaluate
+            initial_capital: Starting capital in quote currency
+            fees: Trading fees (0.001 = 0.1%)
+            slippage: Estimated slippage per trade (0.0005 = 0.05%)
 
-        logger.debug(
-            f"Generated {entries.sum()} entry signals, "
-            f"{exits_overbought.sum()} overbought exits, "
-            f"{exits_stoploss.sum()} stop-loss exits"
+        Returns:
+            Total return (fraction) indexed by (rsi_period, oversold_threshold,
+            overbought_threshold, stop_loss_pct)
+        """
+        close_values = df["close"].to_numpy(dtype=np.float64)
+        close = _shift_one(close_values)
+        rsi = np.column_stack([_cached_rsi(close, period) for period in periods])
+
+        configs = np.array(
+            list(
+                itertools.product(
+                    range(len(periods)),
+                    oversold_thresholds,
+                    overbought_thresholds,
+                    stop_loss_pcts,
+                )
+            ),
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        total_returns = simulate_rsi_grid_kernel(
+            close_values,
+            rsi,
+            configs[:, 0].astype(np.int64),
+            configs[:, 1],
+            configs[:, 2],
+            configs[:, 3],
+            initial_capital,
+            fees,
+            slippage,
         )
 
-        return entries, exits
+        index = pd.MultiIndex.from_product(
+            [list(periods), oversold_thresholds, overbought_thresholds, stop_loss_pcts],
+            names=["rsi_period", "oversold_threshold", "overbought_threshold", "stop_loss_pct"],
+        )
+        logger.debug(f"Simulated {len(index)} RSI parameter combinations")
+        return pd.Series(total_returns, index=index, name="total_return")
 
     def _calculate_stop_loss(
         self, df: pd.DataFrame, entries: pd.Series, stop_loss_pct: float
@@ -109,21 +390,12 @@ class RSIStrategy:
             - Track entry price for each position
             - Exit if current price drops stop_loss_pct% from entry
         """
-        # Forward-fill entry prices to track position entry levels
-        entry_prices = df["close"].where(entries).ffill()
-
-        # Calculate price change from entry
-        current_prices = df["close"]
-        price_change_pct = ((current_prices - entry_prices) / entry_prices) * 100
-
-        # Stop-loss triggered when price drops below threshold
-        stop_loss_signals = price_change_pct < -stop_loss_pct
-
-        # Only trigger stop-loss when in position (after an entry)
-        in_position = entries.cumsum() > 0
-        stop_loss_exits = stop_loss_signals & in_position
-
-        return stop_loss_exits
+        stop_loss_exits = stop_loss_kernel(
+            df["close"].to_numpy(dtype=np.float64),
+            entries.to_numpy(dtype=np.bool_),
+            stop_loss_pct,
+        )
+        return pd.Series(stop_loss_exits, index=df.index, copy=False)
 
     def backtest(
         self,
@@ -146,16 +418,15 @@ class RSIStrategy:
         """
         entries, exits = self.generate_signals(df)
 
-        # Adjust price for slippage
-        price = df["close"] * (1 + slippage)
-
-        # Run portfolio simulation
+        # Run portfolio simulation; slippage worsens each fill price in the
+        # trade direction (buys above close, sells below it)
         portfolio = vbt.Portfolio.from_signals(
-            close=price,
+            close=df["close"],
             entries=entries,
             exits=exits,
             init_cash=initial_capital,
             fees=fees,
+            slippage=slippage,
             freq="1h",  # Adjust based on timeframe
         )
 
@@ -1,11 +1,15 @@
 """Main backtest runner script."""
 
 import argparse
+import csv
+from pathlib import Path
+
+import pandas as pd
 
 from src.backtest.rsi_strategy import RSIStrategy
 from src.backtest.strategy import SMAStrategy
 from src.config import ARTIFACTS_DIR, ensure_directories
-from src.data.binance_client import BinanceDataClient
+from src.data.binance_client import get_data_client
 from src.utils.logger import setup_logger
 
 # Ensure required directories exist (entrypoint responsibility)
@@ -14,6 +18,28 @@ ensure_directories()
 logger = setup_logger(__name__, log_file="backtest.log")
 
 
+def write_stats_csv(stats: pd.Series, output_file: Path) -> None:
+    """
+    Write backtest statistics as ``key,value`` rows.
+
+    Produces the same file as ``stats.to_csv(output_file)`` (header row, NaN as
+    empty) using the csv module directly, which avoids pandas' generic CSV writer
+    for a Series of a few dozen items.
+
+    Args:
+        stats: Statistics from Strategy.get_stats
+        output_file: Destination CSV path
+    """
+    with open(output_file, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["", stats.name if stats.name is not None else 0])
+        for key, value in stats.items():
+            # Missing floats and NaT durations (e.g. with no trades) are both empty
+            if pd.isna(value):
+                value = ""
+            writer.writerow([key, value])
+
+
 def run_backtest(
     symbol: str = "BTCUSDT",
     timeframe: str = "1h",
@@ -54,7 +80,7 @@ def run_backtest(
     # Note: No longer need to calculate required_klines - auto-pagination fetches all data
 
     # Use production Binance for historical data (public endpoint, no auth required)
-    client = BinanceDataClient(testnet=False)
+    client = get_data_client(testnet=False)
     df = client.get_historical_klines(
         symbol=symbol,
         interval=timeframe,
@@ -86,7 +112,7 @@ def run_backtest(
 
     # Save results with strategy name
     output_file = ARTIFACTS_DIR / "backtest" / f"stats_{symbol}_{timeframe}_{strategy_name}.csv"
-    stats.to_csv(output_file)
+    write_stats_csv(stats, output_file)
     logger.info(f"Results saved to {output_file}")
 
     # Print key metrics
@@ -1,7 +1,9 @@
 """Trading strategies for backtesting."""
 
+import numpy as np
 import pandas as pd
 import vectorbt as vbt
+from vectorbt.generic.nb import crossed_above_1d_nb, rolling_mean_1d_nb
 
 from src.utils.logger import setup_logger
 
@@ -35,21 +37,29 @@ class SMAStrategy:
         """
         # Shift close prices to prevent look-ahead bias
         # Signal at bar i uses only data through bar i-1
-        close = df["close"].shift(1)
+        values = df["close"].to_numpy(dtype=np.float64)
+        close = np.empty_like(values)
+        close[:1] = np.nan
+        close[1:] = values[:-1]
 
-        # Calculate SMAs
-        fast_sma = vbt.MA.run(close, self.fast_window, short_name="fast")
-        slow_sma = vbt.MA.run(close, self.slow_window, short_name="slow")
+        # Calculate SMAs with vectorbt's compiled kernels directly on the array,
+        # skipping the indicator factory and Series wrapping of vbt.MA.run
+        fast_sma = rolling_mean_1d_nb(close, self.fast_window)
+        slow_sma = rolling_mean_1d_nb(close, self.slow_window)
 
         # Entry: fast SMA crosses above slow SMA
-        entries = fast_sma.ma_crossed_above(slow_sma)
+        entries = crossed_above_1d_nb(fast_sma, slow_sma)
 
         # Exit: fast SMA crosses below slow SMA
-        exits = fast_sma.ma_crossed_below(slow_sma)
+        exits = crossed_above_1d_nb(slow_sma, fast_sma)
 
         logger.debug(f"Generated {entries.sum()} entry signals, {exits.sum()} exit signals")
 
-        return entries, exits
+        # Wrap the kernel outputs without copying; both share df.index
+        return (
+            pd.Series(entries, index=df.index, copy=False),
+            pd.Series(exits, index=df.index, copy=False),
+        )
 
     def backtest(
         self,
@@ -72,16 +82,15 @@ class SMAStrategy:
         """
         entries, exits = self.generate_signals(df)
 
-        # Adjust price for slippage
-        price = df["close"] * (1 + slippage)
-
-        # Run portfolio simulation
+        # Run portfolio simulation; slippage worsens each fill price in the
+        # trade direction (buys above close, sells below it)
         portfolio = vbt.Portfolio.from_signals(
-            close=price,
+            close=df["close"],
             entries=entries,
             exits=exits,
             init_cash=initial_capital,
             fees=fees,
+            slippage=slippage,
             freq="1h",  # Adjust based on timeframe
         )
 
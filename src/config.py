@@ -29,6 +29,8 @@ class Settings(BaseSettings):
     # Telegram
     telegram_bot_token: str = Field(default="")
     telegram_chat_id: str = Field(default="")
+    telegram_pool_size: int = Field(default=32)
+    telegram_pool_timeout: float = Field(default=5.0)
 
     # Environment
     tz: str = Field(default="Europe/Paris")
@@ -1,14 +1,83 @@
 """Binance API client wrapper for data fetching."""
 
+import asyncio
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+import aiohttp
+import numpy as np
 import pandas as pd
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from binance.helpers import convert_ts_str
+from requests.adapters import HTTPAdapter
 
-from src.config import settings
+from src.config import ARTIFACTS_DIR, settings
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+KLINES_CACHE_DIR = ARTIFACTS_DIR / "klines_cache"
+
+# HTTP connection pool for the REST session (per host, and hosts kept)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
+# REST kline endpoints used by the concurrent batch fetcher
+KLINES_URL = "https://api.binance.com/api/v3/klines"
+KLINES_TESTNET_URL = "https://testnet.binance.vision/api/v3/klines"
+KLINES_PAGE_LIMIT = 1000  # Maximum candles per klines request (request weight 2)
+BATCH_MAX_CONNECTIONS = 10  # Concurrent requests per batch, well under 1200 weight/min
+
+# Candles per day for each kline interval (whole-number intervals only)
+CANDLES_PER_DAY = MappingProxyType(
+    {
+        "1m": 1440,
+        "5m": 288,
+        "15m": 96,
+        "30m": 48,
+        "1h": 24,
+        "2h": 12,
+        "4h": 6,
+        "6h": 4,
+        "8h": 3,
+        "12h": 2,
+        "1d": 1,
+    }
+)
+
+
+def candle_count(interval: str, days: int) -> int:
+    """Number of candles covering ``days`` days of ``interval`` (unknown intervals count as 1h).
+
+    Args:
+        interval: Kline interval (e.g., "1h", "4h", "1d")
+        days: Number of days
+
+    Returns:
+        Candle count
+    """
+    return days * CANDLES_PER_DAY.get(interval, 24)
+
+
+# Field order of a kline row returned by the Binance REST API
+KLINE_COLUMNS = (
+    "timestamp",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_volume",
+    "trades",
+    "taker_buy_base",
+    "taker_buy_quote",
+    "ignore",
+)
+
 
 class BinanceDataClient:
     """Wrapper for Binance client with testnet support."""
@@ -41,6 +110,12 @@ class BinanceDataClient:
             else:
                 logger.info("Initialized Binance PRODUCTION client (public endpoints only)")
 
+        # Keep-alive pool sized for concurrent fetches on one client
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE
+        )
+        self.client.session.mount("https://", adapter)
+
     def get_historical_klines(
         self,
         symbol: str,
@@ -48,16 +123,28 @@ class BinanceDataClient:
         start_str: str | None = None,
         end_str: str | None = None,
         limit: int | None = None,
+        use_cache: bool = True,
+        refresh: bool = False,
     ) -> pd.DataFrame:
         """
         Fetch historical klines (candlestick) data with automatic pagination.
 
+        Requests with a start date are cached as Parquet under KLINES_CACHE_DIR:
+        - Fixed windows (end_str given) are stored per resolved time range and
+          reused as is.
+        - Open-ended, auto-paginated requests share one file per symbol/interval;
+          only candles after the last cached one are fetched and appended.
+        - Open-ended requests with limit <= 1000 are not cached, since their
+          window moves with the current time.
+
         Args:
             symbol: Trading pair (e.g., "BTCUSDT")
             interval: Kline interval (e.g., "1h", "4h", "1d")
             start_str: Start date string (e.g., "1 Jan, 2024" or "90 days ago UTC")
             end_str: End date string (optional)
             limit: Number of klines to fetch (None = fetch all available, auto-paginates)
+            use_cache: Whether to read and write the on-disk kline cache
+            refresh: Ignore cached data and refetch (the cache is rewritten)
 
         Returns:
             DataFrame with OHLCV data
@@ -66,6 +153,190 @@ class BinanceDataClient:
             Binance has a 1000 candle limit per request. If limit > 1000 or limit=None,
             this method automatically paginates to fetch all requested data.
         """
+        if use_cache and start_str is not None:
+            try:
+                if end_str is not None:
+                    return self._get_klines_window(
+                        symbol, interval, start_str, end_str, limit, refresh
+                    )
+                if limit is None or limit > 1000:
+                    return self._get_klines_incremental(symbol, interval, start_str, refresh)
+            except ImportError:
+                # No parquet engine (pyarrow) installed - caching disabled
+                logger.debug("Parquet engine unavailable, kline cache disabled")
+
+        return self._fetch_klines(symbol, interval, start_str, end_str, limit)
+
+    def get_historical_klines_batch(
+        self,
+        symbols: list[str],
+        interval: str,
+        start_str: str,
+        end_str: str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch historical klines for several symbols concurrently.
+
+        Requests for all symbols are issued together over one aiohttp session
+        (at most BATCH_MAX_CONNECTIONS in flight), so network round trips
+        overlap instead of adding up. Each symbol is paginated like
+        get_historical_klines. The on-disk kline cache is not used.
+
+        Args:
+            symbols: Trading pairs (e.g., ["BTCUSDT", "ETHUSDT"])
+            interval: Kline interval (e.g., "1h", "4h", "1d")
+            start_str: Start date string (e.g., "1 Jan, 2024" or "90 days ago UTC")
+            end_str: End date string (optional, defaults to now)
+
+        Returns:
+            Mapping of symbol to its OHLCV DataFrame, in the order of ``symbols``
+
+        Note:
+            Runs its own event loop, so it must not be called from a running loop.
+        """
+        start_ms = convert_ts_str(start_str)
+        end_ms = convert_ts_str(end_str) if end_str is not None else None
+        frames = asyncio.run(self._fetch_klines_batch(symbols, interval, start_ms, end_ms))
+
+        for symbol, df in frames.items():
+            logger.info(f"Fetched {len(df)} klines for {symbol} ({interval})")
+        return frames
+
+    async def _fetch_klines_batch(
+        self, symbols: list[str], interval: str, start_ms: int, end_ms: int | None
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch every symbol's klines concurrently over one shared session."""
+        connector = aiohttp.TCPConnector(limit=BATCH_MAX_CONNECTIONS)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *(
+                    self._fetch_klines_async(session, symbol, interval, start_ms, end_ms)
+                    for symbol in symbols
+                )
+            )
+        return dict(zip(symbols, results, strict=True))
+
+    async def _fetch_klines_async(
+        self,
+        session: aiohttp.ClientSession,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int | None,
+    ) -> pd.DataFrame:
+        """Fetch all klines for one symbol, one page of KLINES_PAGE_LIMIT at a time."""
+        url = KLINES_TESTNET_URL if self.testnet else KLINES_URL
+        params: dict[str, str | int] = {
+            "symbol": symbol,
+            "interval": interval,
+            "limit": KLINES_PAGE_LIMIT,
+        }
+        if end_ms is not None:
+            params["endTime"] = end_ms
+
+        klines: list = []
+        while True:
+            params["startTime"] = start_ms
+            try:
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    page = await response.json()
+            except aiohttp.ClientError as e:
+                logger.error(f"Error fetching klines for {symbol}: {e}")
+                raise
+
+            klines.extend(page)
+            if len(page) < KLINES_PAGE_LIMIT:
+                break
+            # Next page starts after the last open time received
+            start_ms = page[-1][0] + 1
+
+        return self._klines_to_frame(klines)
+
+    def _get_klines_window(
+        self,
+        symbol: str,
+        interval: str,
+        start_str: str,
+        end_str: str,
+        limit: int | None,
+        refresh: bool,
+    ) -> pd.DataFrame:
+        """Return a fixed kline window, from its own cache file when present."""
+        # Key on resolved timestamps so relative dates ("30 days ago UTC") do not
+        # keep serving the window they resolved to on the first call
+        start_ms = convert_ts_str(start_str)
+        end_ms = convert_ts_str(end_str)
+        key = hashlib.blake2b(
+            f"{self._network}|{symbol}|{interval}|{start_ms}|{end_ms}|{limit}".encode(),
+            digest_size=8,
+        ).hexdigest()
+        cache_path = KLINES_CACHE_DIR / f"{symbol}_{interval}_{key}.parquet"
+
+        if not refresh:
+            try:
+                df = pd.read_parquet(cache_path)
+                logger.info(f"Loaded {len(df)} cached klines for {symbol} ({interval})")
+                return df
+            except FileNotFoundError:
+                pass
+
+        df = self._fetch_klines(symbol, interval, start_str, end_str, limit)
+        self._write_cache(df, cache_path)
+        return df
+
+    def _get_klines_incremental(
+        self, symbol: str, interval: str, start_str: str, refresh: bool
+    ) -> pd.DataFrame:
+        """Return klines from start_str to now, fetching only what the cache lacks."""
+        cache_path = KLINES_CACHE_DIR / f"{symbol}_{interval}_{self._network}.parquet"
+        start = pd.Timestamp(convert_ts_str(start_str), unit="ms")
+
+        cached = None
+        if not refresh:
+            try:
+                cached = pd.read_parquet(cache_path)
+            except FileNotFoundError:
+                pass
+
+        if cached is None or cached.empty or cached.index[0] > start:
+            df = self._fetch_klines(symbol, interval, start_str, None, None)
+        else:
+            # Refetch from the last cached candle, which may have been incomplete
+            last_open_ms = cached.index[-1].value // 1_000_000
+            new = self._fetch_klines(symbol, interval, last_open_ms, None, None)
+            df = pd.concat([cached[cached.index < new.index[0]], new]) if len(new) else cached
+            logger.info(
+                f"Extended cached klines for {symbol} ({interval}): "
+                f"{len(cached)} cached, {len(new)} fetched"
+            )
+
+        self._write_cache(df, cache_path)
+        return df[df.index >= start]
+
+    @property
+    def _network(self) -> str:
+        """Network name used to keep testnet and production kline caches apart."""
+        return "testnet" if self.testnet else "prod"
+
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+        """Write klines to the cache, logging instead of failing on I/O errors."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path, compression="zstd")
+        except OSError as e:
+            logger.warning(f"Could not write kline cache {cache_path}: {e}")
+
+    def _fetch_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_str: str | int | None,
+        end_str: str | None,
+        limit: int | None,
+    ) -> pd.DataFrame:
+        """Fetch klines from the Binance REST API and build the OHLCV DataFrame."""
         try:
             # If limit is None or > 1000, use python-binance's automatic pagination
             # by NOT passing a limit parameter (fetches all data between start_str and end_str)
@@ -86,30 +357,7 @@ class BinanceDataClient:
                     limit=limit,
                 )
 
-            df = pd.DataFrame(
-                klines,
-                columns=[
-                    "timestamp",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "close_time",
-                    "quote_volume",
-                    "trades",
-                    "taker_buy_base",
-                    "taker_buy_quote",
-                    "ignore",
-                ],
-            )
-
-            # Convert types
-            df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-            df.set_index("timestamp", inplace=True)
-
-            for col in ["open", "high", "low", "close", "volume"]:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+            df = self._klines_to_frame(klines)
 
             logger.info(f"Fetched {len(df)} klines for {symbol} ({interval})")
             return df
@@ -120,3 +368,39 @@ class BinanceDataClient:
         except Exception as e:
             logger.error(f"Unexpected error fetching klines: {e}")
             raise
+
+    @staticmethod
+    def _klines_to_frame(klines: list) -> pd.DataFrame:
+        """Build the OHLCV DataFrame from raw kline rows."""
+        # One object array, then one float64 cast for all numeric columns
+        # instead of a 12-column frame of strings plus per-column to_numeric
+        rows = np.array(klines, dtype=object).reshape(-1, len(KLINE_COLUMNS))
+
+        # Open times are epoch milliseconds: reinterpret as datetime64[ms]
+        # rather than going through pd.to_datetime's parser dispatch
+        index = pd.DatetimeIndex(
+            rows[:, 0].astype(np.int64).view("datetime64[ms]"), name="timestamp"
+        )
+        df = pd.DataFrame(
+            rows[:, 1:11].astype(np.float64), index=index, columns=list(KLINE_COLUMNS[1:11])
+        )
+        df["close_time"] = df["close_time"].astype(np.int64)
+        df["trades"] = df["trades"].astype(np.int64)
+        df["ignore"] = rows[:, 11]
+        return df
+
+
+@lru_cache(maxsize=2)
+def get_data_client(testnet: bool = True) -> BinanceDataClient:
+    """Return a shared BinanceDataClient per network.
+
+    Reusing one client keeps its HTTP session (and TLS connection) alive across
+    backtests and optimisation runs instead of reconnecting and pinging each time.
+
+    Args:
+        testnet: If True, the testnet client; otherwise the production client
+
+    Returns:
+        Shared client instance
+    """
+    return BinanceDataClient(testnet=testnet)
@@ -0,0 +1,319 @@
+"""Numba-compiled indicator kernels for the CPU feature path.
+
+Each kernel walks its input arrays once and reproduces the pandas-based
+reference implementation in ``gpu_features`` (same rolling-mean definitions
+and NaN placement), so results are interchangeable.
+
+Import ``NUMBA_AVAILABLE`` before using a kernel; without numba the module
+still imports but the kernels are unavailable.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # fastmath is left off since it assumes no NaNs, and NaN placement is part of the
+    # contract; the numpy error model turns x/0 into inf/NaN instead of raising
+    @njit(cache=True, error_model="numpy")
+    def adx_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+        """Average Directional Index in a single fused pass.
+
+        True range, +DM and -DM feed running window sums. +DI, -DI and DX are
+        derived per bar, and DX feeds a second window sum for ADX. All
+        windows are simple trailing means of ``period`` bars, as in
+        ``pandas.Series.rolling(period).mean()``.
+
+        Inputs must not contain NaN; a NaN price would poison the running sums.
+
+        Sliding sums leave rounding residues once large values leave the window.
+        TR and DM are non-negative, so each window also counts its non-zero
+        entries and its sum is reset to exactly 0 when that count reaches 0. A
+        flat stretch then gives 0/0 = NaN, as the windowed means do, instead of
+        DI values built from residues (which read as a maximal trend).
+
+        Args:
+            high: High prices (float64)
+            low: Low prices (float64)
+            close: Close prices (float64)
+            period: Window length
+
+        Returns:
+            ADX values, NaN until enough valid history is available
+        """
+        n = high.shape[0]
+        out = np.full(n, np.nan)
+
+        tr_buf = np.zeros(period)
+        plus_buf = np.zeros(period)
+        minus_buf = np.zeros(period)
+        dx_buf = np.zeros(period)
+        dx_nan_buf = np.zeros(period, dtype=np.bool_)
+
+        tr_sum = 0.0
+        plus_sum = 0.0
+        minus_sum = 0.0
+        tr_nonzero = 0
+        plus_nonzero = 0
+        minus_nonzero = 0
+        dx_sum = 0.0
+        dx_nan_count = 0
+
+        for i in range(n):
+            slot = i % period
+
+            # True range and directional movement for this bar
+            if i == 0:
+                tr = high[0] - low[0]
+                plus_dm = 0.0
+                minus_dm = 0.0
+            else:
+                prev_close = close[i - 1]
+                tr = max(
+                    high[i] - low[i],
+                    math.fabs(high[i] - prev_close),
+                    math.fabs(low[i] - prev_close),
+                )
+                up = high[i] - high[i - 1]
+                down = low[i - 1] - low[i]
+                plus_dm = up if (up > down and up > 0.0) else 0.0
+                minus_dm = down if (down > up and down > 0.0) else 0.0
+
+            # Slide the TR / DM windows
+            if i >= period:
+                tr_sum -= tr_buf[slot]
+                plus_sum -= plus_buf[slot]
+                minus_sum -= minus_buf[slot]
+                tr_nonzero -= tr_buf[slot] != 0.0
+                plus_nonzero -= plus_buf[slot] != 0.0
+                minus_nonzero -= minus_buf[slot] != 0.0
+            tr_buf[slot] = tr
+            plus_buf[slot] = plus_dm
+            minus_buf[slot] = minus_dm
+            tr_sum += tr
+            plus_sum += plus_dm
+            minus_sum += minus_dm
+            tr_nonzero += tr != 0.0
+            plus_nonzero += plus_dm != 0.0
+            minus_nonzero += minus_dm != 0.0
+
+            # An all-zero window sums to exactly 0, whatever residue subtraction left
+            if tr_nonzero == 0:
+                tr_sum = 0.0
+            if plus_nonzero == 0:
+                plus_sum = 0.0
+            if minus_nonzero == 0:
+                minus_sum = 0.0
+
+            if i < period - 1:
+                continue
+
+            atr = tr_sum / period
+            plus_di = 100.0 * (plus_sum / period) / atr
+            minus_di = 100.0 * (minus_sum / period) / atr
+            dx = 100.0 * math.fabs(plus_di - minus_di) / (plus_di + minus_di)
+
+            # Slide the DX window, counting NaNs so a NaN anywhere in it yields NaN
+            k = i - (period - 1)
+            dx_slot = k % period
+            if k >= period:
+                if dx_nan_buf[dx_slot]:
+                    dx_nan_count -= 1
+                else:
+                    dx_sum -= dx_buf[dx_slot]
+            if math.isnan(dx):
+                dx_nan_buf[dx_slot] = True
+                dx_buf[dx_slot] = 0.0
+                dx_nan_count += 1
+            else:
+                dx_nan_buf[dx_slot] = False
+                dx_buf[dx_slot] = dx
+                dx_sum += dx
+
+            if k >= period - 1 and dx_nan_count == 0:
+                out[i] = dx_sum / period
+
+        return out
+
+    @njit(cache=True, error_model="numpy")
+    def rolling_means_kernel(values: np.ndarray, windows: np.ndarray) -> np.ndarray:
+        """Trailing means of ``values`` for several windows in a single pass.
+
+        Each bar is read once and added to one running sum per window (the bar
+        leaving each window is subtracted), so N moving averages cost one scan
+        instead of N. Matches ``pandas.Series.rolling(w).mean()`` for every
+        ``w``: NaN for the first ``w - 1`` bars and wherever the window holds NaN.
+
+        Args:
+            values: Input series (float64), may contain NaN
+            windows: Window lengths (int64)
+
+        Returns:
+            ``len(windows) x len(values)`` array; row ``k`` is the mean for ``windows[k]``
+        """
+        n = values.shape[0]
+        n_windows = windows.shape[0]
+        out = np.full((n_windows, n), np.nan)
+        sums = np.zeros(n_windows)
+        nan_counts = np.zeros(n_windows, dtype=np.int64)
+
+        for i in range(n):
+            value = values[i]
+            value_nan = math.isnan(value)
+            for k in range(n_windows):
+                window = windows[k]
+                if value_nan:
+                    nan_counts[k] += 1
+                else:
+                    sums[k] += value
+                if i >= window:
+                    old = values[i - window]
+                    if math.isnan(old):
+                        nan_counts[k] -= 1
+                    else:
+                        sums[k] -= old
+                if i >= window - 1 and nan_counts[k] == 0:
+                    out[k, i] = sums[k] / window
+
+        return out
+
+    @njit(cache=True, error_model="numpy")
+    def ewm_means_kernel(values: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+        """Exponential moving averages of ``values`` for several smoothing factors.
+
+        Each bar is read once and folded into one recurrence per alpha. The
+        update follows pandas' ``ewm(alpha=a, adjust=False).mean()`` step by
+        step (including its NaN weighting), so results agree bit for bit.
+
+        Args:
+            values: Input series (float64), may contain NaN
+            alphas: Smoothing factors, e.g. ``2 / (span + 1)``
+
+        Returns:
+            ``len(alphas) x len(values)`` array; row ``k`` is the EMA for ``alphas[k]``
+        """
+        n = values.shape[0]
+        n_alphas = alphas.shape[0]
+        out = np.full((n_alphas, n), np.nan)
+        if n == 0:
+            return out
+
+        weighted = np.full(n_alphas, values[0])
+        old_wt = np.ones(n_alphas)
+        observed = not math.isnan(values[0])
+        if observed:
+            out[:, 0] = values[0]
+
+        for i in range(1, n):
+            value = values[i]
+            is_observation = not math.isnan(value)
+            observed = observed or is_observation
+            for k in range(n_alphas):
+                alpha = alphas[k]
+                if not math.isnan(weighted[k]):
+                    # A missing bar still ages the previous average
+                    old_wt[k] *= 1.0 - alpha
+                    if is_observation:
+                        if weighted[k] != value:
+                            weighted[k] = (old_wt[k] * weighted[k] + alpha * value) / (
+                                old_wt[k] + alpha
+                            )
+                        old_wt[k] = 1.0
+                elif is_observation:
+                    weighted[k] = value
+                if observed:
+                    out[k, i] = weighted[k]
+
+        return out
+
+    @njit(cache=True, error_model="numpy")
+    def rsi_kernel(close: np.ndarray, period: int) -> np.ndarray:
+        """Relative Strength Index with simple trailing means, in a single pass.
+
+        Matches ``GPUFeatureEngine._rsi`` on the CPU: gains and losses of each
+        price change (a missing change counts as zero) are averaged over
+        ``period`` bars with running window sums, as ``rolling_means_kernel`` does.
+        As in ``adx_kernel``, a window with no gains (or no losses) has its sum
+        reset to exactly 0, so a flat stretch gives NaN (0/0) rather than an
+        RSI built from rounding residues.
+
+        Args:
+            close: Close prices (float64)
+            period: Window length
+
+        Returns:
+            RSI values, NaN for the first ``period - 1`` bars
+        """
+        n = close.shape[0]
+        out = np.full(n, np.nan)
+        gain_sum = 0.0
+        loss_sum = 0.0
+        gain_count = 0
+        loss_count = 0
+
+        for i in range(n):
+            delta = close[i] - close[i - 1] if i > 0 else np.nan
+            if delta > 0.0:
+                gain_sum += delta
+                gain_count += 1
+            elif delta < 0.0:
+                loss_sum -= delta
+                loss_count += 1
+            if i >= period:
+                old = close[i - period] - close[i - period - 1] if i > period else np.nan
+                if old > 0.0:
+                    gain_sum -= old
+                    gain_count -= 1
+                elif old < 0.0:
+                    loss_sum += old
+                    loss_count -= 1
+            # An all-zero window sums to exactly 0, whatever residue subtraction left
+            if gain_count == 0:
+                gain_sum = 0.0
+            if loss_count == 0:
+                loss_sum = 0.0
+            if i >= period - 1:
+                rs = (gain_sum / period) / (loss_sum / period)
+                out[i] = 100.0 - 100.0 / (1.0 + rs)
+
+        return out
+
+    @njit(cache=True, error_model="numpy")
+    def obv_kernel(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        """On-Balance Volume in a single pass.
+
+        Adds volume on up bars and subtracts it on down bars; unchanged prices
+        and the first bar add zero. As with ``cumsum``, a missing volume gives
+        NaN on its own bar and is skipped in the running total.
+
+        Args:
+            close: Close prices (float64)
+            volume: Volumes (float64)
+
+        Returns:
+            OBV values
+        """
+        n = close.shape[0]
+        out = np.empty(n)
+        total = 0.0
+
+        for i in range(n):
+            if math.isnan(volume[i]):
+                out[i] = np.nan
+                continue
+            if i > 0 and close[i] > close[i - 1]:
+                total += volume[i]
+            elif i > 0 and close[i] < close[i - 1]:
+                total -= volume[i]
+            out[i] = total
+
+        return out
@@ -14,15 +14,28 @@ Performance:
 Usage:
     >>> engine = GPUFeatureEngine()
     >>> df_cpu = pd.DataFrame({'close': [100, 101, 102, ...]})
-    >>> df_gpu = engine.calculate_all_features(df_cpu)
-    >>> df_result = df_gpu.to_pandas()  # Convert back to CPU if needed
+    >>> df_result = engine.calculate_all_features(df_cpu)  # pandas in, pandas out
+    >>> # Keep data on the device between steps (no host round trip):
+    >>> df_gpu = engine.calculate_all_features_gpu(cudf.from_pandas(df_cpu))
 """
 
 import warnings
+from collections.abc import Mapping
 
 import numpy as np
 import pandas as pd
 
+from src.data.processors._indicator_kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from src.data.processors._indicator_kernels import (
+        adx_kernel,
+        ewm_means_kernel,
+        obv_kernel,
+        rolling_means_kernel,
+        rsi_kernel,
+    )
+
 try:
     import cudf
 
@@ -35,19 +48,94 @@ except ImportError:
     )
 
 
+def _rolling_mean_np(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean matching pandas ``rolling(window).mean()``.
+
+    The first ``window - 1`` outputs, and any window containing NaN, are NaN.
+    """
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        out[window - 1 :] = np.lib.stride_tricks.sliding_window_view(values, window).mean(axis=1)
+    return out
+
+
+def _rolling_sums_prefix(
+    values: "cudf.Series | pd.Series", windows: list[int]
+) -> "list[cudf.Series | pd.Series]":
+    """Trailing rolling sums from one prefix sum: ``cs[i] - cs[i - window]`` per window.
+
+    Works on pandas and cuDF Series. Every window costs one subtraction on
+    top of a single cumsum, instead of a ``rolling()`` scan. As with
+    ``rolling(window).sum()``, the first ``window - 1`` bars and windows
+    holding NaN are NaN. Differences of large running totals lose a few
+    low-order digits on very long series.
+    """
+    csum = values.fillna(0).cumsum()
+    nan_count = values.isna().astype("int64").cumsum()
+
+    sums = []
+    for window in windows:
+        window_sum = csum - csum.shift(window, fill_value=0)
+        window_nans = nan_count - nan_count.shift(window, fill_value=0)
+        window_sum = window_sum.where(window_nans == 0)
+        window_sum.iloc[: window - 1] = np.nan
+        sums.append(window_sum)
+    return sums
+
+
+def _true_range_np(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range on float64 arrays, matching the row-wise max of the three ranges.
+
+    ``fmax`` skips NaN like ``DataFrame.max(axis=1)``, so the first bar (no
+    previous close) gets ``high - low``.
+    """
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    tr: np.ndarray = np.fmax(
+        np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close)
+    )
+    return tr
+
+
+def _adx_np(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """Average Directional Index on float64 arrays (CPU path of ``GPUFeatureEngine._adx``)."""
+    high_diff = np.empty_like(high)
+    low_diff = np.empty_like(low)
+    high_diff[0] = low_diff[0] = np.nan
+    np.subtract(high[1:], high[:-1], out=high_diff[1:])
+    np.subtract(low[:-1], low[1:], out=low_diff[1:])
+
+    # NaN comparisons are False, so the first bar gets zero directional movement
+    plus_dm = np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0.0)
+    minus_dm = np.where((low_diff > high_diff) & (low_diff > 0), low_diff, 0.0)
+
+    atr = _rolling_mean_np(_true_range_np(high, low, close), period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100 * (_rolling_mean_np(plus_dm, period) / atr)
+        minus_di = 100 * (_rolling_mean_np(minus_dm, period) / atr)
+        dx = 100 * (np.abs(plus_di - minus_di) / (plus_di + minus_di))
+
+    return _rolling_mean_np(dx, period)
+
+
 class GPUFeatureEngine:
     """GPU-accelerated technical indicator calculator using cuDF.
 
     Automatically falls back to CPU if GPU unavailable.
     """
 
-    def __init__(self, use_gpu: bool = True) -> None:
+    def __init__(self, use_gpu: bool = True, feature_dtype: str | None = None) -> None:
         """Initialize GPU feature engine.
 
         Args:
             use_gpu: Whether to use GPU acceleration. Auto-disabled if cuDF unavailable.
+            feature_dtype: Dtype for the indicator columns (e.g. "float32" to halve
+                their memory and transfer size). Indicators are still computed in
+                float64, since running sums and cumulative volumes lose too much
+                precision in float32; only the results are cast. None keeps float64.
         """
         self.use_gpu = use_gpu and GPU_AVAILABLE
+        self.feature_dtype = feature_dtype
         if use_gpu and not GPU_AVAILABLE:
             warnings.warn(
                 "GPU requested but cuDF not available. Using CPU fallback.",
@@ -55,17 +143,66 @@ class GPUFeatureEngine:
             )
 
     def calculate_all_features(
-        self, df: pd.DataFrame, ohlcv_cols: dict | None = None
+        self, df: "pd.DataFrame | Mapping[str, np.ndarray]", ohlcv_cols: dict | None = None
     ) -> pd.DataFrame:
         """Calculate all technical indicators.
 
         Args:
-            df: DataFrame with OHLCV data
+            df: DataFrame with OHLCV data, or a mapping of column name -> array
+                (e.g. raw NumPy columns, wrapped into a DataFrame without a copy)
             ohlcv_cols: Column name mapping. Defaults to {'open', 'high', 'low', 'close', 'volume'}
 
         Returns:
             DataFrame with original columns + 50+ technical indicators
         """
+        # Convert to cuDF if GPU enabled (the only host->device copy)
+        if isinstance(df, Mapping):
+            # Arrays are wrapped, not copied; the CPU path then works on this frame directly
+            df = pd.DataFrame(df, copy=False)
+            if self.use_gpu:
+                df_gpu = cudf.from_pandas(df)
+            else:
+                df_gpu = df
+        elif self.use_gpu:
+            df_gpu = cudf.from_pandas(df)
+        else:
+            # Indicators are attached to a new frame, so the input needs no copy
+            df_gpu = df
+
+        df_gpu = self._add_all_indicators(df_gpu, ohlcv_cols)
+
+        # Convert back to pandas if needed (the only device->host copy)
+        if self.use_gpu:
+            return df_gpu.to_pandas()  # type: ignore[no-any-return]
+        return df_gpu  # type: ignore[no-any-return]
+
+    def calculate_all_features_gpu(
+        self, df_gpu: "cudf.DataFrame", ohlcv_cols: dict | None = None
+    ) -> "cudf.DataFrame":
+        """Calculate all technical indicators on a frame already on the GPU.
+
+        Device in, device out: no host<->device transfer happens here, so
+        downstream GPU consumers can keep the result resident (e.g. pass
+        ``df_gpu.to_dlpack()`` or ``df_gpu.values`` to PyTorch/CuPy).
+
+        Args:
+            df_gpu: cuDF DataFrame with OHLCV data (left unmodified)
+            ohlcv_cols: Column name mapping. Defaults to {'open', 'high', 'low', 'close', 'volume'}
+
+        Returns:
+            cuDF DataFrame with original columns + 50+ technical indicators
+
+        Raises:
+            RuntimeError: If the engine is not using the GPU
+        """
+        if not self.use_gpu:
+            raise RuntimeError("calculate_all_features_gpu requires cuDF and use_gpu=True")
+        return self._add_all_indicators(df_gpu, ohlcv_cols)
+
+    def _add_all_indicators(
+        self, df: "cudf.DataFrame | pd.DataFrame", ohlcv_cols: dict | None
+    ) -> "cudf.DataFrame | pd.DataFrame":
+        """Return ``df`` with every indicator group added, on its current device."""
         if ohlcv_cols is None:
             ohlcv_cols = {
                 "open": "open",
@@ -75,179 +212,279 @@ class GPUFeatureEngine:
                 "volume": "volume",
             }
 
-        # Convert to cuDF if GPU enabled
-        if self.use_gpu:
-            df_gpu = cudf.from_pandas(df)
-        else:
-            df_gpu = df.copy()
+        # Intermediates shared between indicator groups (close diff, typical
+        # price, 20-bar mean, ATR-14), computed once by whichever group runs first
+        cache: dict = {}
+
+        # New columns are collected here and attached in one concat at the end,
+        # rather than inserted into ``df`` one at a time (~55 reallocations)
+        features: dict = {}
 
         # Momentum indicators
-        df_gpu = self._add_momentum_indicators(df_gpu, ohlcv_cols)
+        self._add_momentum_indicators(df, ohlcv_cols, features, cache)
 
         # Volatility indicators
-        df_gpu = self._add_volatility_indicators(df_gpu, ohlcv_cols)
+        self._add_volatility_indicators(df, ohlcv_cols, features, cache)
 
         # Volume indicators
-        df_gpu = self._add_volume_indicators(df_gpu, ohlcv_cols)
+        self._add_volume_indicators(df, ohlcv_cols, features, cache)
 
         # Trend indicators
-        df_gpu = self._add_trend_indicators(df_gpu, ohlcv_cols)
+        self._add_trend_indicators(df, ohlcv_cols, features, cache)
 
-        # Convert back to pandas if needed
-        if self.use_gpu:
-            return df_gpu.to_pandas()  # type: ignore[no-any-return]
-        return df_gpu  # type: ignore[no-any-return]
+        # Recomputed indicators replace same-named input columns, as before
+        df = df.drop(columns=[name for name in features if name in df.columns])
+        if isinstance(df, pd.DataFrame):
+            feature_frame = pd.DataFrame(features, index=df.index, copy=False)
+        else:
+            feature_frame = cudf.DataFrame(features)
+        if self.feature_dtype is not None:
+            # Cast on the device, before any device->host copy
+            feature_frame = feature_frame.astype(self.feature_dtype)
+        concat = pd.concat if isinstance(df, pd.DataFrame) else cudf.concat
+        return concat([df, feature_frame], axis=1)
 
     def _add_momentum_indicators(
-        self, df: "cudf.DataFrame | pd.DataFrame", cols: dict
-    ) -> "cudf.DataFrame | pd.DataFrame":
-        """Add momentum-based indicators."""
+        self,
+        df: "cudf.DataFrame | pd.DataFrame",
+        cols: dict,
+        features: dict,
+        cache: dict | None = None,
+    ) -> None:
+        """Add momentum-based indicators to ``features``."""
+        cache = {} if cache is None else cache
         close = df[cols["close"]]
         high = df[cols["high"]]
         low = df[cols["low"]]
 
-        # RSI (7, 14, 21 periods)
+        # RSI (7, 14, 21 periods), sharing one price diff
+        if "close_diff" not in cache:
+            cache["close_diff"] = close.diff()
         for period in [7, 14, 21]:
-            df[f"rsi_{period}"] = self._rsi(close, period)
+            features[f"rsi_{period}"] = self._rsi(close, period, delta=cache["close_diff"])
+
+        # EMAs of close used by MACD and the trend group, in one pass
+        ema_periods = [12, 26, 50]
+        for period, ema in zip(ema_periods, self._emas(close, ema_periods), strict=True):
+            cache[f"ema_{period}"] = ema
 
         # MACD (12, 26, 9)
-        macd, signal, hist = self._macd(close, 12, 26, 9)
-        df["macd"] = macd
-        df["macd_signal"] = signal
-        df["macd_hist"] = hist
+        macd, signal, hist = self._macd(
+            close, 12, 26, 9, ema_fast=cache["ema_12"], ema_slow=cache["ema_26"]
+        )
+        features["macd"] = macd
+        features["macd_signal"] = signal
+        features["macd_hist"] = hist
 
         # Rate of Change
         for period in [5, 10, 20]:
-            df[f"roc_{period}"] = self._roc(close, period)
+            features[f"roc_{period}"] = self._roc(close, period)
 
         # Williams %R
-        df["williams_r"] = self._williams_r(high, low, close, 14)
+        features["williams_r"] = self._williams_r(high, low, close, 14)
 
         # Momentum
         for period in [10, 20]:
-            df[f"momentum_{period}"] = close - close.shift(period)
-
-        return df
+            features[f"momentum_{period}"] = close - close.shift(period)
 
     def _add_volatility_indicators(
-        self, df: "cudf.DataFrame | pd.DataFrame", cols: dict
-    ) -> "cudf.DataFrame | pd.DataFrame":
-        """Add volatility-based indicators."""
+        self,
+        df: "cudf.DataFrame | pd.DataFrame",
+        cols: dict,
+        features: dict,
+        cache: dict | None = None,
+    ) -> None:
+        """Add volatility-based indicators to ``features``."""
+        cache = {} if cache is None else cache
         close = df[cols["close"]]
         high = df[cols["high"]]
         low = df[cols["low"]]
 
         # Bollinger Bands (20-period, 2 std)
         bb_upper, bb_middle, bb_lower = self._bollinger_bands(close, 20, 2.0)
-        df["bb_upper"] = bb_upper
-        df["bb_middle"] = bb_middle
-        df["bb_lower"] = bb_lower
-        df["bb_width"] = (bb_upper - bb_lower) / bb_middle
-        df["bb_position"] = (close - bb_lower) / (bb_upper - bb_lower)
-
-        # ATR (Average True Range)
-        for period in [7, 14, 21]:
-            df[f"atr_{period}"] = self._atr(high, low, close, period)
+        cache["sma_20"] = bb_middle
+        features["bb_upper"] = bb_upper
+        features["bb_middle"] = bb_middle
+        features["bb_lower"] = bb_lower
+        # Band range is shared by width and position: materialize it once
+        bb_range = bb_upper - bb_lower
+        features["bb_width"] = bb_range / bb_middle
+        # A flat window has zero std, but the running-sum middle band can sit a
+        # rounding error off the close: mask the zero range so bb_position is NaN
+        # (0/0, as with pandas means) rather than +/-inf
+        features["bb_position"] = (close - bb_lower) / bb_range.where(bb_range != 0)
+
+        # ATR (Average True Range): one true range, all windows in one scan
+        atr_periods = [7, 14, 21]
+        atrs = self._rolling_means(self._true_range(high, low, close), atr_periods)
+        for period, atr in zip(atr_periods, atrs, strict=True):
+            features[f"atr_{period}"] = atr
+            cache[f"atr_{period}"] = atr
 
         # Historical Volatility (rolling std of returns)
         returns = close.pct_change()
         for period in [10, 20, 30]:
-            df[f"volatility_{period}"] = returns.rolling(period).std() * np.sqrt(252)
-
-        return df
+            features[f"volatility_{period}"] = returns.rolling(period).std() * np.sqrt(252)
 
     def _add_volume_indicators(
-        self, df: "cudf.DataFrame | pd.DataFrame", cols: dict
-    ) -> "cudf.DataFrame | pd.DataFrame":
-        """Add volume-based indicators."""
+        self,
+        df: "cudf.DataFrame | pd.DataFrame",
+        cols: dict,
+        features: dict,
+        cache: dict | None = None,
+    ) -> None:
+        """Add volume-based indicators to ``features``."""
+        cache = {} if cache is None else cache
         close = df[cols["close"]]
         high = df[cols["high"]]
         low = df[cols["low"]]
         volume = df[cols["volume"]]
+        if "typical_price" not in cache:
+            cache["typical_price"] = (high + low + close) / 3
+        typical_price = cache["typical_price"]
 
         # OBV (On-Balance Volume)
-        df["obv"] = self._obv(close, volume)
+        features["obv"] = self._obv(close, volume, price_diff=cache.get("close_diff"))
 
         # Volume Rate of Change
         for period in [5, 10]:
-            df[f"volume_roc_{period}"] = self._roc(volume, period)
+            features[f"volume_roc_{period}"] = self._roc(volume, period)
 
         # VWAP (Volume Weighted Average Price)
-        df["vwap"] = self._vwap(high, low, close, volume)
+        features["vwap"] = self._vwap(high, low, close, volume, typical_price=typical_price)
 
         # Money Flow Index
-        df["mfi"] = self._mfi(high, low, close, volume, 14)
+        features["mfi"] = self._mfi(high, low, close, volume, 14, typical_price=typical_price)
 
         # Volume SMA ratio
-        for period in [10, 20]:
-            vol_sma = volume.rolling(period).mean()
-            df[f"volume_ratio_{period}"] = volume / vol_sma
-
-        return df
+        ratio_periods = [10, 20]
+        vol_smas = self._rolling_means(volume, ratio_periods)
+        for period, vol_sma in zip(ratio_periods, vol_smas, strict=True):
+            features[f"volume_ratio_{period}"] = volume / vol_sma
 
     def _add_trend_indicators(
-        self, df: "cudf.DataFrame | pd.DataFrame", cols: dict
-    ) -> "cudf.DataFrame | pd.DataFrame":
-        """Add trend-based indicators."""
+        self,
+        df: "cudf.DataFrame | pd.DataFrame",
+        cols: dict,
+        features: dict,
+        cache: dict | None = None,
+    ) -> None:
+        """Add trend-based indicators to ``features``."""
+        cache = {} if cache is None else cache
         close = df[cols["close"]]
         high = df[cols["high"]]
         low = df[cols["low"]]
 
-        # SMA (Simple Moving Average)
-        for period in [5, 10, 20, 50, 200]:
-            df[f"sma_{period}"] = close.rolling(period).mean()
-
-        # EMA (Exponential Moving Average)
-        for period in [12, 26, 50]:
-            df[f"ema_{period}"] = self._ema(close, period)
+        # SMA (Simple Moving Average), all windows not yet cached in one scan
+        sma_periods = [5, 10, 20, 50, 200]
+        missing = [period for period in sma_periods if f"sma_{period}" not in cache]
+        for period, sma in zip(missing, self._rolling_means(close, missing), strict=True):
+            cache[f"sma_{period}"] = sma
+        for period in sma_periods:
+            features[f"sma_{period}"] = cache[f"sma_{period}"]
+
+        # EMA (Exponential Moving Average), reusing the momentum group's EMAs
+        ema_periods = [12, 26, 50]
+        missing = [period for period in ema_periods if f"ema_{period}" not in cache]
+        for period, ema in zip(missing, self._emas(close, missing), strict=True):
+            cache[f"ema_{period}"] = ema
+        for period in ema_periods:
+            features[f"ema_{period}"] = cache[f"ema_{period}"]
 
         # ADX (Average Directional Index)
-        df["adx"] = self._adx(high, low, close, 14)
+        features["adx"] = self._adx(high, low, close, 14, atr=cache.get("atr_14"))
 
         # Price position relative to MAs
-        df["price_sma20_ratio"] = close / df["sma_20"]
-        df["price_sma50_ratio"] = close / df["sma_50"]
-
-        return df
+        features["price_sma20_ratio"] = close / features["sma_20"]
+        features["price_sma50_ratio"] = close / features["sma_50"]
 
     # ========== Core Indicator Implementations ==========
 
+    def _rolling_means(
+        self, values: "cudf.Series | pd.Series", windows: list[int]
+    ) -> "list[cudf.Series | pd.Series]":
+        """Trailing rolling means of ``values`` for each window in ``windows``.
+
+        On the CPU with numba, all windows come from one fused pass over the
+        data instead of one ``rolling().mean()`` scan per window. On the GPU,
+        they are derived from a single prefix sum, since cuDF's rolling
+        aggregations scale poorly with window size.
+        """
+        if self.use_gpu:
+            return [
+                window_sum / window
+                for window, window_sum in zip(
+                    windows, _rolling_sums_prefix(values, windows), strict=True
+                )
+            ]
+        if NUMBA_AVAILABLE:
+            means = rolling_means_kernel(
+                values.to_numpy(dtype=np.float64), np.asarray(windows, dtype=np.int64)
+            )
+            return [pd.Series(row, index=values.index, copy=False) for row in means]
+        return [values.rolling(window).mean() for window in windows]
+
     def _rsi(
-        self, prices: "cudf.Series | pd.Series", period: int = 14
+        self,
+        prices: "cudf.Series | pd.Series",
+        period: int = 14,
+        delta: "cudf.Series | pd.Series | None" = None,
     ) -> "cudf.Series | pd.Series":
-        """Calculate RSI (Relative Strength Index)."""
-        delta = prices.diff()
-        gain = delta.copy()
-        loss = delta.copy()
+        """Calculate RSI (Relative Strength Index).
 
-        if self.use_gpu:
-            gain[gain < 0] = 0  # type: ignore[operator]
-            loss[loss > 0] = 0  # type: ignore[operator]
-        else:
-            gain = gain.where(gain > 0, 0)  # type: ignore[operator]
-            loss = -loss.where(loss < 0, 0)  # type: ignore[operator]
+        ``delta`` may pass a precomputed ``prices.diff()`` to share it across periods.
+        """
+        if not self.use_gpu and NUMBA_AVAILABLE:
+            # One compiled pass over the prices (the diff is derived inline)
+            rsi = rsi_kernel(prices.to_numpy(dtype=np.float64), period)
+            return pd.Series(rsi, index=prices.index, copy=False)
 
-        avg_gain = gain.rolling(period).mean()
-        avg_loss = loss.abs().rolling(period).mean()
+        if delta is None:
+            delta = prices.diff()
+
+        # One select per side; the first bar (NaN delta) counts as no movement
+        gain = delta.where(delta > 0, 0)  # type: ignore[operator]
+        loss = (-delta).where(delta < 0, 0)  # type: ignore[operator]
+
+        (avg_gain,) = self._rolling_means(gain, [period])
+        (avg_loss,) = self._rolling_means(loss, [period])
 
         rs = avg_gain / avg_loss
         rsi = 100 - (100 / (1 + rs))
         return rsi
 
     def _macd(
-        self, prices: "cudf.Series | pd.Series", fast: int = 12, slow: int = 26, signal: int = 9
+        self,
+        prices: "cudf.Series | pd.Series",
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+        ema_fast: "cudf.Series | pd.Series | None" = None,
+        ema_slow: "cudf.Series | pd.Series | None" = None,
     ) -> tuple:
-        """Calculate MACD (Moving Average Convergence Divergence)."""
-        ema_fast = self._ema(prices, fast)
-        ema_slow = self._ema(prices, slow)
+        """Calculate MACD (Moving Average Convergence Divergence).
+
+        ``ema_fast`` and ``ema_slow`` may pass precomputed EMAs of ``prices``.
+        """
+        if ema_fast is None or ema_slow is None:
+            ema_fast, ema_slow = self._emas(prices, [fast, slow])
         macd = ema_fast - ema_slow
-        signal_line = self._ema(macd, signal)
+        (signal_line,) = self._emas(macd, [signal])
         histogram = macd - signal_line
         return macd, signal_line, histogram
 
-    def _ema(self, prices: "cudf.Series | pd.Series", period: int) -> "cudf.Series | pd.Series":
-        """Calculate EMA (Exponential Moving Average)."""
-        return prices.ewm(span=period, adjust=False).mean()
+    def _emas(
+        self, prices: "cudf.Series | pd.Series", periods: list[int]
+    ) -> "list[cudf.Series | pd.Series]":
+        """Calculate EMAs (``ewm(span=period, adjust=False)``) of ``prices`` for each period.
+
+        On the CPU with numba, all spans come from one fused pass over the data.
+        """
+        if not self.use_gpu and NUMBA_AVAILABLE:
+            alphas = np.array([2.0 / (1.0 + period) for period in periods])
+            emas = ewm_means_kernel(prices.to_numpy(dtype=np.float64), alphas)
+            return [pd.Series(row, index=prices.index, copy=False) for row in emas]
+        return [prices.ewm(span=period, adjust=False).mean() for period in periods]
 
     def _roc(self, prices: "cudf.Series | pd.Series", period: int) -> "cudf.Series | pd.Series":
         """Calculate Rate of Change."""
@@ -270,7 +507,7 @@ class GPUFeatureEngine:
         self, prices: "cudf.Series | pd.Series", period: int = 20, num_std: float = 2.0
     ) -> tuple:
         """Calculate Bollinger Bands."""
-        middle = prices.rolling(period).mean()
+        (middle,) = self._rolling_means(prices, [period])
         std = prices.rolling(period).std()
         upper = middle + (std * num_std)
         lower = middle - (std * num_std)
@@ -284,20 +521,39 @@ class GPUFeatureEngine:
         period: int = 14,
     ) -> "cudf.Series | pd.Series":
         """Calculate Average True Range."""
-        tr1 = high - low
-        tr2 = (high - close.shift(1)).abs()
-        tr3 = (low - close.shift(1)).abs()
+        (atr,) = self._rolling_means(self._true_range(high, low, close), [period])
+        return atr
 
-        if self.use_gpu:
-            tr = cudf.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        else:
-            tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    def _true_range(
+        self,
+        high: "cudf.Series | pd.Series",
+        low: "cudf.Series | pd.Series",
+        close: "cudf.Series | pd.Series",
+    ) -> "cudf.Series | pd.Series":
+        """Calculate True Range."""
+        if not self.use_gpu:
+            # Plain ndarray math instead of three Series plus a concat/max DataFrame
+            tr = _true_range_np(
+                high.to_numpy(dtype=np.float64),
+                low.to_numpy(dtype=np.float64),
+                close.to_numpy(dtype=np.float64),
+            )
+            return pd.Series(tr, index=high.index)
 
-        atr = tr.rolling(period).mean()
-        return atr
+        # Elementwise NaN-skipping max (like np.fmax) instead of concat + row-wise
+        # max, which materializes a 3-column frame; the first bar gets high - low
+        prev_close = close.shift(1)
+        tr1 = high - low
+        tr2 = (high - prev_close).abs()
+        tr3 = (low - prev_close).abs()
+        tr = tr1.where((tr1 >= tr2) | tr2.isna(), tr2)
+        return tr.where((tr >= tr3) | tr3.isna(), tr3)
 
     def _obv(
-        self, close: "cudf.Series | pd.Series", volume: "cudf.Series | pd.Series"
+        self,
+        close: "cudf.Series | pd.Series",
+        volume: "cudf.Series | pd.Series",
+        price_diff: "cudf.Series | pd.Series | None" = None,
     ) -> "cudf.Series | pd.Series":
         """Calculate On-Balance Volume.
 
@@ -305,15 +561,20 @@ class GPUFeatureEngine:
         - Price up: add volume
         - Price down: subtract volume
         - Price unchanged or NaN: add zero
+
+        ``price_diff`` may pass a precomputed ``close.diff()``.
         """
-        price_diff = close.diff()
+        if not self.use_gpu and NUMBA_AVAILABLE and volume.dtype == np.float64:
+            # Narrower volumes keep the pandas path, whose cumsum stays in that dtype
+            obv = obv_kernel(close.to_numpy(dtype=np.float64), volume.to_numpy(dtype=np.float64))
+            return pd.Series(obv, index=close.index, copy=False)
 
-        # Create direction-adjusted volume (unified for CPU and GPU)
-        obv_direction = volume.copy()
-        obv_direction[price_diff > 0] = volume[price_diff > 0]  # type: ignore[operator]
-        obv_direction[price_diff < 0] = -volume[price_diff < 0]  # type: ignore[operator]
-        obv_direction[price_diff == 0] = 0  # type: ignore[operator]
-        obv_direction[price_diff.isna()] = 0  # First row (no previous price)
+        if price_diff is None:
+            price_diff = close.diff()
+
+        # Direction-adjusted volume in one multiply (unified for CPU and GPU);
+        # the first row has no previous price, so its NaN sign counts as zero
+        obv_direction = volume * np.sign(price_diff).fillna(0)
 
         return obv_direction.cumsum()
 
@@ -323,9 +584,11 @@ class GPUFeatureEngine:
         low: "cudf.Series | pd.Series",
         close: "cudf.Series | pd.Series",
         volume: "cudf.Series | pd.Series",
+        typical_price: "cudf.Series | pd.Series | None" = None,
     ) -> "cudf.Series | pd.Series":
         """Calculate Volume Weighted Average Price."""
-        typical_price = (high + low + close) / 3
+        if typical_price is None:
+            typical_price = (high + low + close) / 3
         return (typical_price * volume).cumsum() / volume.cumsum()
 
     def _mfi(
@@ -335,24 +598,24 @@ class GPUFeatureEngine:
         close: "cudf.Series | pd.Series",
         volume: "cudf.Series | pd.Series",
         period: int = 14,
+        typical_price: "cudf.Series | pd.Series | None" = None,
     ) -> "cudf.Series | pd.Series":
         """Calculate Money Flow Index."""
-        typical_price = (high + low + close) / 3
+        if typical_price is None:
+            typical_price = (high + low + close) / 3
         money_flow = typical_price * volume
 
         price_diff = typical_price.diff()
-        positive_flow = money_flow.copy()
-        negative_flow = money_flow.copy()
+        positive_flow = money_flow.where(price_diff > 0, 0)  # type: ignore[operator]
+        negative_flow = money_flow.where(price_diff < 0, 0)  # type: ignore[operator]
 
         if self.use_gpu:
-            positive_flow[price_diff <= 0] = 0  # type: ignore[operator]
-            negative_flow[price_diff >= 0] = 0  # type: ignore[operator]
+            positive_mf, negative_mf = (
+                _rolling_sums_prefix(flow, [period])[0] for flow in (positive_flow, negative_flow)
+            )
         else:
-            positive_flow = positive_flow.where(price_diff > 0, 0)  # type: ignore[operator]
-            negative_flow = negative_flow.where(price_diff < 0, 0)  # type: ignore[operator]
-
-        positive_mf = positive_flow.rolling(period).sum()
-        negative_mf = negative_flow.rolling(period).sum()
+            positive_mf = positive_flow.rolling(period).sum()
+            negative_mf = negative_flow.rolling(period).sum()
 
         mfi = 100 - (100 / (1 + (positive_mf / negative_mf)))
         return mfi
@@ -363,31 +626,47 @@ class GPUFeatureEngine:
         low: "cudf.Series | pd.Series",
         close: "cudf.Series | pd.Series",
         period: int = 14,
+        atr: "cudf.Series | pd.Series | None" = None,
     ) -> "cudf.Series | pd.Series":
-        """Calculate Average Directional Index."""
+        """Calculate Average Directional Index.
+
+        ``atr`` may pass a precomputed ATR over ``period``; only the GPU path
+        uses it, the CPU kernels derive true range inline.
+        """
+        if not self.use_gpu:
+            # Plain ndarray math avoids ~15 intermediate Series and a concat per call
+            h = high.to_numpy(dtype=np.float64)
+            lo = low.to_numpy(dtype=np.float64)
+            c = close.to_numpy(dtype=np.float64)
+            if NUMBA_AVAILABLE and not np.isnan(h + lo + c).any():
+                # One fused compiled pass; NaN gaps need the windowed NumPy version
+                adx = adx_kernel(h, lo, c, period)
+            else:
+                adx = _adx_np(h, lo, c, period)
+            return pd.Series(adx, index=high.index)
+
         # Calculate +DM and -DM
         high_diff = high.diff()
         low_diff = -low.diff()
 
-        plus_dm = high_diff.copy()
-        minus_dm = low_diff.copy()
-
-        if self.use_gpu:
-            plus_dm[(high_diff < low_diff) | (high_diff < 0)] = 0  # type: ignore[operator]
-            minus_dm[(low_diff < high_diff) | (low_diff < 0)] = 0  # type: ignore[operator]
-        else:
-            plus_dm = plus_dm.where((high_diff > low_diff) & (high_diff > 0), 0)  # type: ignore[operator]
-            minus_dm = minus_dm.where((low_diff > high_diff) & (low_diff > 0), 0)  # type: ignore[operator]
+        # Same strict comparisons as the CPU path; ties and NaN give zero movement
+        mask_plus = (high_diff > low_diff) & (high_diff > 0)  # type: ignore[operator]
+        mask_minus = (low_diff > high_diff) & (low_diff > 0)  # type: ignore[operator]
+        plus_dm = high_diff.where(mask_plus, 0)
+        minus_dm = low_diff.where(mask_minus, 0)
 
-        # Calculate ATR
-        atr = self._atr(high, low, close, period)
+        # Calculate ATR (unless already computed for the volatility group)
+        if atr is None:
+            atr = self._atr(high, low, close, period)
 
         # Calculate +DI and -DI
-        plus_di = 100 * (plus_dm.rolling(period).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(period).mean() / atr)
+        (plus_dm_mean,) = self._rolling_means(plus_dm, [period])
+        (minus_dm_mean,) = self._rolling_means(minus_dm, [period])
+        plus_di = 100 * (plus_dm_mean / atr)
+        minus_di = 100 * (minus_dm_mean / atr)
 
         # Calculate DX and ADX
         dx = 100 * ((plus_di - minus_di).abs() / (plus_di + minus_di))
-        adx = dx.rolling(period).mean()
+        (adx,) = self._rolling_means(dx, [period])
 
         return adx
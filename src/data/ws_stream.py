@@ -9,7 +9,7 @@ This module provides real-time price feeds via Binance WebSocket API with:
 
 import time
 from queue import Queue
-from threading import Event, Lock, Thread
+from threading import Event, Lock, Thread, current_thread
 from typing import Any
 
 from binance import ThreadedWebsocketManager
@@ -39,15 +39,19 @@ class WebSocketHealthMonitor:
         """
         self.timeout_seconds = timeout_seconds
         self.check_interval_seconds = check_interval_seconds
-        self.last_message_time: float = time.monotonic()
+        # Integer nanoseconds: no float allocation per recorded message
+        self._timeout_ns = timeout_seconds * 1_000_000_000
+        self.last_message_time: int = time.monotonic_ns()
         self.lock = Lock()
         self._running = False
         self._watchdog_thread: Thread | None = None
+        # Set by stop_watchdog to wake the watchdog out of its wait immediately
+        self._stop_evt = Event()
 
     def record_message(self) -> None:
         """Record that a message was received."""
         with self.lock:
-            self.last_message_time = time.monotonic()
+            self.last_message_time = time.monotonic_ns()
 
     def is_healthy(self) -> bool:
         """Check if connection is healthy based on last message time.
@@ -56,8 +60,8 @@ class WebSocketHealthMonitor:
             True if messages received within timeout window
         """
         with self.lock:
-            elapsed = time.monotonic() - self.last_message_time
-            return elapsed < self.timeout_seconds
+            elapsed_ns = time.monotonic_ns() - self.last_message_time
+            return elapsed_ns < self._timeout_ns
 
     def start_watchdog(self, reconnect_queue: Queue[str]) -> None:
         """Start background watchdog thread.
@@ -70,11 +74,14 @@ class WebSocketHealthMonitor:
             return
 
         self._running = True
+        self._stop_evt.clear()
 
         def watchdog_loop() -> None:
             try:
                 while self._running:
-                    time.sleep(self.check_interval_seconds)
+                    # Interruptible wait: returns True as soon as stop_watchdog() is called
+                    if self._stop_evt.wait(self.check_interval_seconds):
+                        return
                     if not self.is_healthy():
                         logger.error(
                             f"WebSocket unhealthy: no messages for {self.timeout_seconds}s"
@@ -98,6 +105,7 @@ class WebSocketHealthMonitor:
     def stop_watchdog(self) -> None:
         """Stop watchdog thread and reset state for clean restart."""
         self._running = False
+        self._stop_evt.set()
         if self._watchdog_thread and self._watchdog_thread.is_alive():
             self._watchdog_thread.join(timeout=2.0)
         # Reset thread reference so start_watchdog can create a new one
@@ -114,13 +122,22 @@ class BinanceWebSocketStream:
     - Connection health monitoring via watchdog
     - Graceful degradation to REST API when WebSocket fails
     - Thread-safe operation
+    - Optional shared mode: streams created with ``use_shared=True`` ride one
+      multiplexed connection instead of opening one connection per symbol
     """
 
+    # Shared multiplex connection, one per process (see use_shared)
+    _shared_twm: ThreadedWebsocketManager | None = None
+    _shared_symbols: dict[str, "BinanceWebSocketStream"] = {}
+    _shared_stream_key: str | None = None
+    _shared_lock = Lock()
+
     def __init__(
         self,
         symbol: str,
         testnet: bool = True,
         enable_rest_fallback: bool = True,
+        use_shared: bool = False,
     ) -> None:
         """Initialize WebSocket stream.
 
@@ -128,10 +145,13 @@ class BinanceWebSocketStream:
             symbol: Trading pair (e.g., "BTCUSDT")
             testnet: Use testnet API (True) or production (False)
             enable_rest_fallback: Enable automatic REST fallback on failure
+            use_shared: Subscribe through the process-wide multiplex connection
+                shared by all started streams created with this flag
         """
         self.symbol = symbol.upper()
         self.testnet = testnet
         self.enable_rest_fallback = enable_rest_fallback
+        self.use_shared = use_shared
 
         # WebSocket manager (python-binance ThreadedWebsocketManager)
         self.twm: ThreadedWebsocketManager | None = None
@@ -158,15 +178,17 @@ class BinanceWebSocketStream:
         self.health_monitor = WebSocketHealthMonitor(timeout_seconds=60)
 
         # Latest market data (thread-safe access)
-        self._latest_data: dict[str, Any] = {}
-        self._data_lock = Lock()
+        # (best_bid, best_ask, raw message) of the latest update. Only ever
+        # replaced as a whole (one atomic reference swap under the GIL), so readers
+        # need no lock and always see a bid, ask and message from the same update.
+        self._latest: tuple[float | None, float | None, dict[str, Any]] | None = None
 
         # REST fallback (lazy initialization)
         self._rest_client: Any = None
 
         logger.info(
             f"Initialized WebSocket stream for {symbol} "
-            f"(testnet={testnet}, fallback={enable_rest_fallback})"
+            f"(testnet={testnet}, fallback={enable_rest_fallback}, shared={use_shared})"
         )
 
     def _init_websocket_manager(self) -> None:
@@ -184,6 +206,73 @@ class BinanceWebSocketStream:
         self.twm.start()
         logger.info("Started ThreadedWebsocketManager")
 
+    # Shared multiplex connection
+
+    def _register_shared(self) -> None:
+        """Register this stream on the shared multiplex connection.
+
+        Caller holds _shared_lock.
+
+        Raises:
+            ValueError: If another started stream already has this symbol, or
+                registered shared streams use the other network
+        """
+        cls = BinanceWebSocketStream
+        registered = cls._shared_symbols.get(self.symbol)
+        if registered is not None and registered is not self:
+            raise ValueError(f"A shared WebSocket stream for {self.symbol} is already running")
+
+        other = next(iter(cls._shared_symbols.values()), None)
+        if other is not None and other.testnet != self.testnet:
+            raise ValueError(
+                f"Shared WebSocket already open on testnet={other.testnet}, "
+                f"cannot add {self.symbol} with testnet={self.testnet}"
+            )
+        cls._shared_symbols[self.symbol] = self
+
+    @classmethod
+    def _resubscribe_shared(cls) -> None:
+        """Replace the multiplex socket with one covering every registered symbol.
+
+        Stops the shared manager once no symbols remain. Caller holds _shared_lock.
+        """
+        if cls._shared_twm is None:
+            return
+
+        if cls._shared_stream_key:
+            cls._shared_twm.stop_socket(cls._shared_stream_key)
+            cls._shared_stream_key = None
+
+        if not cls._shared_symbols:
+            cls._shared_twm.stop()
+            cls._shared_twm = None
+            logger.info("Stopped shared ThreadedWebsocketManager")
+            return
+
+        streams = [f"{symbol.lower()}@bookTicker" for symbol in cls._shared_symbols]
+        cls._shared_stream_key = cls._shared_twm.start_multiplex_socket(
+            callback=cls._dispatch, streams=streams
+        )
+        logger.info(f"Started shared bookTicker multiplex for {len(streams)} symbols")
+
+    @classmethod
+    def _dispatch(cls, msg: dict[str, Any]) -> None:
+        """Route a multiplex message to the stream registered for its symbol.
+
+        Args:
+            msg: Combined-stream message ({"stream": "btcusdt@bookTicker", "data": {...}})
+        """
+        stream_name = msg.get("stream")
+        if stream_name is None:
+            # Connection-level error: affects every stream on the socket
+            for stream in list(cls._shared_symbols.values()):
+                stream._handle_error(msg)
+            return
+
+        target = cls._shared_symbols.get(stream_name.partition("@")[0].upper())
+        if target is not None:
+            target._handle_message(msg["data"])
+
     def _handle_message(self, msg: dict[str, Any]) -> None:
         """Receive incoming WebSocket message and enqueue for processing.
 
@@ -220,9 +309,15 @@ class BinanceWebSocketStream:
                 # Block until message available (with timeout for clean shutdown)
                 msg = self._message_queue.get(timeout=1.0)
 
-                # Update latest data (thread-safe)
-                with self._data_lock:
-                    self._latest_data = msg
+                # Parse prices once here rather than on every price read, then
+                # publish the new snapshot (single reference swap, no lock)
+                bid = msg.get("b")
+                ask = msg.get("a")
+                self._latest = (
+                    float(bid) if bid is not None else None,
+                    float(ask) if ask is not None else None,
+                    msg,
+                )
 
                 # Log first message for debugging
                 if not self._connected:
@@ -282,23 +377,29 @@ class BinanceWebSocketStream:
         """Control thread that handles reconnection requests from watchdog.
 
         This prevents the watchdog from blocking on itself when calling stop().
+        Blocks without a timeout (no wakeups while idle) until stop() sends "stop".
         """
-        while not self._stop_event.is_set():
-            try:
-                # Block until watchdog signals reconnection (with timeout)
-                signal = self._reconnect_queue.get(timeout=1.0)
-                if signal == "reconnect":
-                    logger.info("Control thread received reconnect signal")
+        while True:
+            signal = self._reconnect_queue.get()
+            if signal == "stop":
+                return
+            if signal == "reconnect":
+                logger.info("Control thread received reconnect signal")
+                try:
                     self._attempt_reconnect()
-            except Exception:
-                # Timeout or queue closed - continue monitoring
-                continue
+                except Exception as e:
+                    # Keep the thread alive so later reconnect signals are still handled
+                    logger.exception(f"Reconnection attempt failed: {e}")
 
     def start(self) -> None:
         """Start WebSocket stream for bookTicker data.
 
         Subscribes to real-time best bid/ask price updates.
         Starts processing thread for message handling.
+
+        Raises:
+            ValueError: In shared mode, if another started stream has this symbol
+                or the shared connection is open on the other network
         """
         if self._stop_event.is_set():
             self._stop_event.clear()
@@ -315,18 +416,21 @@ class BinanceWebSocketStream:
             self._control_thread.start()
             logger.info("Started WebSocket control thread")
 
-        # Initialize manager if needed
-        if self.twm is None:
-            self._init_websocket_manager()
-
         # Start bookTicker stream
         try:
-            assert self.twm is not None
-            self._stream_key = self.twm.start_symbol_book_ticker_socket(
-                callback=self._handle_message,
-                symbol=self.symbol,
-            )
-            logger.info(f"Started bookTicker stream for {self.symbol}")
+            if self.use_shared:
+                self._start_shared()
+            else:
+                # Initialize manager if needed
+                if self.twm is None:
+                    self._init_websocket_manager()
+
+                assert self.twm is not None
+                self._stream_key = self.twm.start_symbol_book_ticker_socket(
+                    callback=self._handle_message,
+                    symbol=self.symbol,
+                )
+                logger.info(f"Started bookTicker stream for {self.symbol}")
 
             # Start health monitoring (signals via queue instead of callback)
             self.health_monitor.start_watchdog(reconnect_queue=self._reconnect_queue)
@@ -335,15 +439,42 @@ class BinanceWebSocketStream:
             logger.error(f"Failed to start WebSocket stream: {e}")
             raise
 
+    def _start_shared(self) -> None:
+        """Add this symbol to the shared multiplex connection, opening it if needed."""
+        cls = BinanceWebSocketStream
+        with cls._shared_lock:
+            self._register_shared()
+            if cls._shared_twm is None:
+                self._init_websocket_manager()
+                cls._shared_twm = self.twm
+            self.twm = cls._shared_twm
+            cls._resubscribe_shared()
+
     def stop(self) -> None:
         """Stop WebSocket stream and cleanup resources."""
         self._stop_event.set()
 
+        # Wake the control thread so it exits, unless stop() is running on it as
+        # part of a reconnect (the thread must survive to handle later signals)
+        control_thread = self._control_thread
+        if control_thread is not None and control_thread is not current_thread():
+            self._reconnect_queue.put("stop")
+            control_thread.join(timeout=2.0)
+
         # Stop health monitoring
         self.health_monitor.stop_watchdog()
 
         # Stop WebSocket stream
-        if self.twm is not None:
+        if self.use_shared:
+            cls = BinanceWebSocketStream
+            with cls._shared_lock:
+                if cls._shared_symbols.get(self.symbol) is self:
+                    del cls._shared_symbols[self.symbol]
+                try:
+                    cls._resubscribe_shared()
+                except Exception as e:
+                    logger.error(f"Error updating shared WebSocket: {e}")
+        elif self.twm is not None:
             try:
                 if self._stream_key:
                     self.twm.stop_socket(self._stream_key)
@@ -377,8 +508,8 @@ class BinanceWebSocketStream:
             (update_id, best_bid, bid_qty, best_ask, ask_qty)
             None if no data received yet
         """
-        with self._data_lock:
-            return self._latest_data.copy() if self._latest_data else None
+        latest = self._latest
+        return latest[2].copy() if latest and latest[2] else None
 
     def get_best_bid(self) -> float | None:
         """Get current best bid price.
@@ -386,10 +517,8 @@ class BinanceWebSocketStream:
         Returns:
             Best bid price or None if unavailable
         """
-        ticker = self.get_latest_ticker()
-        if ticker and "b" in ticker:
-            return float(ticker["b"])
-        return None
+        latest = self._latest
+        return latest[0] if latest else None
 
     def get_best_ask(self) -> float | None:
         """Get current best ask price.
@@ -397,10 +526,8 @@ class BinanceWebSocketStream:
         Returns:
             Best ask price or None if unavailable
         """
-        ticker = self.get_latest_ticker()
-        if ticker and "a" in ticker:
-            return float(ticker["a"])
-        return None
+        latest = self._latest
+        return latest[1] if latest else None
 
     def get_mid_price(self) -> float | None:
         """Calculate mid price from best bid/ask.
@@ -408,8 +535,11 @@ class BinanceWebSocketStream:
         Returns:
             Mid price ((bid + ask) / 2) or None if unavailable
         """
-        bid = self.get_best_bid()
-        ask = self.get_best_ask()
+        # One snapshot read, so bid and ask come from the same message
+        latest = self._latest
+        if latest is None:
+            return None
+        bid, ask, _ = latest
 
         if bid is not None and ask is not None:
             return (bid + ask) / 2.0
@@ -256,11 +256,15 @@ class PositionTracker:
             List of Position objects
         """
         with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM positions WHERE status = 'OPEN' ORDER BY entry_time DESC"
-            )
-            rows = cursor.fetchall()
+            return self._fetch_all_open_positions(conn)
+
+    def _fetch_all_open_positions(self, conn: sqlite3.Connection) -> list[Position]:
+        """Query all open positions on an existing connection."""
+        conn.row_factory = sqlite3.Row
+        cursor = conn.execute(
+            "SELECT * FROM positions WHERE status = 'OPEN' ORDER BY entry_time DESC"
+        )
+        rows = cursor.fetchall()
 
         positions = []
         for row in rows:
@@ -309,9 +313,12 @@ class PositionTracker:
             Number of open positions across all symbols
         """
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM positions WHERE status = 'OPEN'")
-            count = cursor.fetchone()[0]
+            return self._fetch_open_count(conn)
 
+    def _fetch_open_count(self, conn: sqlite3.Connection) -> int:
+        """Count open positions on an existing connection."""
+        cursor = conn.execute("SELECT COUNT(*) FROM positions WHERE status = 'OPEN'")
+        count: int = cursor.fetchone()[0]
         return count
 
     def calculate_unrealized_pnl(self, symbol: str, current_price: Decimal) -> Decimal | None:
@@ -360,30 +367,36 @@ class PositionTracker:
             List of closed Position objects
         """
         with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+            return self._fetch_position_history(conn, symbol, limit)
 
-            if symbol:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM positions
-                    WHERE symbol = ? AND status = 'CLOSED'
-                    ORDER BY exit_time DESC
-                    LIMIT ?
-                    """,
-                    (symbol, limit),
-                )
-            else:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM positions
-                    WHERE status = 'CLOSED'
-                    ORDER BY exit_time DESC
-                    LIMIT ?
-                    """,
-                    (limit,),
-                )
+    def _fetch_position_history(
+        self, conn: sqlite3.Connection, symbol: str | None, limit: int
+    ) -> list[Position]:
+        """Query closed positions on an existing connection."""
+        conn.row_factory = sqlite3.Row
 
-            rows = cursor.fetchall()
+        if symbol:
+            cursor = conn.execute(
+                """
+                SELECT * FROM positions
+                WHERE symbol = ? AND status = 'CLOSED'
+                ORDER BY exit_time DESC
+                LIMIT ?
+                """,
+                (symbol, limit),
+            )
+        else:
+            cursor = conn.execute(
+                """
+                SELECT * FROM positions
+                WHERE status = 'CLOSED'
+                ORDER BY exit_time DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+
+        rows = cursor.fetchall()
 
         positions = []
         for row in rows:
@@ -406,3 +419,27 @@ class PositionTracker:
             )
 
         return positions
+
+    def snapshot(self, history_limit: int = 10) -> tuple[list[Position], list[Position], int]:
+        """
+        Read open positions, recent history and open count in one transaction.
+
+        Uses a single connection and read transaction instead of one per query,
+        so the three results are mutually consistent.
+
+        Args:
+            history_limit: Maximum number of closed positions to return
+
+        Returns:
+            Tuple of (open positions, recent closed positions, open position count)
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("BEGIN")
+            try:
+                open_positions = self._fetch_all_open_positions(conn)
+                history = self._fetch_position_history(conn, None, history_limit)
+                open_count = self._fetch_open_count(conn)
+            finally:
+                conn.rollback()  # Read-only: nothing to commit
+
+        return open_positions, history, open_count
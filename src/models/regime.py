@@ -169,23 +169,46 @@ class MarketRegimeDetector:
         Returns:
             Dictionary of regime statistics
         """
+        values = returns.iloc[: len(regimes)].to_numpy(dtype=np.float64)
+        labels = np.asarray(regimes, dtype=np.intp)
+
+        # One bincount pass per moment instead of a boolean mask per regime;
+        # squared deviations are taken from each regime's own mean (two-pass variance)
+        counts = np.bincount(labels, minlength=self.n_states)
+
+        # Moments skip missing returns (e.g. the leading pct_change NaN) like
+        # pandas mean()/std(); frequency still counts every labelled bar
+        valid = ~np.isnan(values)
+        values, valid_labels = values[valid], labels[valid]
+        valid_counts = np.bincount(valid_labels, minlength=self.n_states)
+        sums = np.bincount(valid_labels, weights=values, minlength=self.n_states)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / valid_counts
+            sq_dev = np.bincount(
+                valid_labels,
+                weights=(values - means[valid_labels]) ** 2,
+                minlength=self.n_states,
+            )
+            # Sample std (ddof=1) like pandas; NaN for single-sample regimes
+            stds = np.sqrt(sq_dev / (valid_counts - 1))
+        stds[valid_counts < 2] = np.nan
+
         stats = {}
 
         for regime_id in range(self.n_states):
-            mask = regimes == regime_id
-            regime_returns = returns.iloc[: len(regimes)][mask]
+            n_samples = counts[regime_id]
 
-            if len(regime_returns) > 0:
-                mean_return = regime_returns.mean()
-                volatility = regime_returns.std()
+            if n_samples > 0:
+                mean_return = means[regime_id]
+                volatility = stds[regime_id]
                 sharpe = (mean_return / volatility * np.sqrt(252)) if volatility > 0 else 0.0
 
                 stats[regime_id] = {
                     "mean_return": mean_return,
                     "volatility": volatility,
                     "sharpe": sharpe,
-                    "frequency": mask.sum() / len(regimes),
-                    "total_samples": mask.sum(),
+                    "frequency": n_samples / len(regimes),
+                    "total_samples": n_samples,
                 }
             else:
                 stats[regime_id] = {
@@ -208,12 +231,14 @@ class MarketRegimeDetector:
         Returns:
             Transition matrix as DataFrame
         """
-        transitions = np.zeros((self.n_states, self.n_states))
-
-        for i in range(len(regimes) - 1):
-            from_regime = regimes[i]
-            to_regime = regimes[i + 1]
-            transitions[from_regime, to_regime] += 1
+        # Count (from, to) pairs in one bincount over flattened indices
+        labels = np.asarray(regimes, dtype=np.intp)
+        pair_index = labels[:-1] * self.n_states + labels[1:]
+        transitions = (
+            np.bincount(pair_index, minlength=self.n_states * self.n_states)
+            .reshape(self.n_states, self.n_states)
+            .astype(np.float64)
+        )
 
         # Normalize to probabilities
         row_sums = transitions.sum(axis=1, keepdims=True)
@@ -142,15 +142,21 @@ class XGBoostGPUModel:
         X_val: pd.DataFrame | np.ndarray | None = None,
         y_val: pd.Series | np.ndarray | None = None,
         verbose: bool = True,
+        feature_names: list[str] | None = None,
     ) -> dict[str, float]:
         """Train XGBoost model on training data.
 
+        Training data is binned once into a QuantileDMatrix (the layout the
+        ``hist`` tree method consumes); the validation set reuses its bin
+        boundaries instead of re-quantizing.
+
         Args:
             X_train: Training features (DataFrame or array)
             y_train: Training labels (Series or array)
             X_val: Validation features (optional, for early stopping)
             y_val: Validation labels (optional, for early stopping)
             verbose: Whether to print training progress
+            feature_names: Feature names for array inputs (ignored for DataFrames)
 
         Returns:
             Dict with training metrics
@@ -160,6 +166,8 @@ class XGBoostGPUModel:
             self.feature_names = list(X_train.columns)
             X_train_array = X_train.values
         else:
+            if feature_names is not None:
+                self.feature_names = list(feature_names)
             X_train_array = X_train
 
         if isinstance(y_train, pd.Series):
@@ -167,8 +175,13 @@ class XGBoostGPUModel:
         else:
             y_train_array = y_train
 
-        # Create DMatrix for training
-        dtrain = xgb.DMatrix(X_train_array, label=y_train_array, feature_names=self.feature_names)
+        # Create quantized DMatrix for training
+        dtrain = xgb.QuantileDMatrix(
+            X_train_array,
+            label=y_train_array,
+            feature_names=self.feature_names or None,
+            max_bin=self.params.get("max_bin", 256),
+        )
 
         # Setup evaluation sets
         evals = [(dtrain, "train")]
@@ -183,7 +196,12 @@ class XGBoostGPUModel:
             else:
                 y_val_array = y_val
 
-            dval = xgb.DMatrix(X_val_array, label=y_val_array, feature_names=self.feature_names)
+            dval = xgb.QuantileDMatrix(
+                X_val_array,
+                label=y_val_array,
+                feature_names=self.feature_names or None,
+                ref=dtrain,
+            )
             evals.append((dval, "validation"))
 
         # Train model
@@ -248,7 +266,7 @@ class XGBoostGPUModel:
         else:
             X_array = X
 
-        dtest = xgb.DMatrix(X_array, feature_names=self.feature_names)
+        dtest = xgb.DMatrix(X_array, feature_names=self.feature_names or None)
         probabilities = self.model.predict(dtest)
 
         # Convert probabilities to binary predictions
@@ -274,7 +292,7 @@ class XGBoostGPUModel:
         else:
             X_array = X
 
-        dtest = xgb.DMatrix(X_array, feature_names=self.feature_names)
+        dtest = xgb.DMatrix(X_array, feature_names=self.feature_names or None)
         probabilities = self.model.predict(dtest)
 
         return probabilities
@@ -353,6 +371,9 @@ class XGBoostGPUModel:
         """
         self.model = xgb.Booster()
         self.model.load_model(filepath)
+        self.feature_names = list(self.model.feature_names or [])
+        if hasattr(self.model, "best_iteration"):
+            self.best_iteration = self.model.best_iteration
         logger.info(f"Model loaded from {filepath}")
 
     def walk_forward_validation(
@@ -283,10 +283,13 @@ class PerformanceTracker:
                 "recommendation": "Insufficient data points",
             }
 
-        # Linear regression on Sharpe 7d
-        x = np.arange(len(recent))
-        y = recent["sharpe_7d"].values
-        slope, intercept = np.polyfit(x, y, 1)
+        # Linear regression on Sharpe 7d against sample index 0..n-1.
+        # Closed-form least-squares slope: sum((x - x̄)(y - ȳ)) / sum((x - x̄)²),
+        # where sum((x - x̄)²) = n(n² - 1) / 12 for evenly spaced x.
+        y = recent["sharpe_7d"].to_numpy(dtype=np.float64)
+        n = len(y)
+        x_centered = np.arange(n) - (n - 1) / 2
+        slope = float(x_centered @ (y - y.mean())) / (n * (n * n - 1) / 12)
 
         # Predict days until threshold
         current_sharpe = y[-1]
@@ -4,6 +4,8 @@ This module implements Sprint 2.3 metrics from Phase 13 observability plan.
 Exposes trading state, risk management, and system health metrics.
 """
 
+from collections.abc import Mapping
+
 from prometheus_client import Counter, Gauge, Histogram, CollectorRegistry, generate_latest
 
 # Create separate registry to avoid conflicts with other Prometheus exporters
@@ -183,6 +185,12 @@ lab_worktree_test_status = Gauge(
 )
 
 
+# Status → gauge value mappings for LAB metrics
+MCP_HEALTH_VALUES = {"down": 0.0, "up": 1.0, "not_configured": 2.0}
+WORKTREE_STATUS_VALUES = {"complete": 0.0, "working": 1.0, "testing": 2.0, "blocked": 3.0}
+WORKTREE_TEST_STATUS_VALUES = {"unknown": 0.0, "passing": 1.0, "failing": 2.0}
+
+
 def update_mcp_health(server_name: str, status: str) -> None:
     """Update MCP server health metric.
 
@@ -190,9 +198,8 @@ def update_mcp_health(server_name: str, status: str) -> None:
         server_name: MCP server name (e.g., "rag-query", "context7")
         status: Health status ("up", "down", "not_configured")
     """
-    status_map = {"down": 0.0, "up": 1.0, "not_configured": 2.0}
     lab_mcp_server_health.labels(server_name=server_name).set(
-        status_map.get(status.lower(), 0.0)
+        MCP_HEALTH_VALUES.get(status.lower(), 0.0)
     )
 
 
@@ -203,9 +210,8 @@ def update_worktree_status(worktree_name: str, status: str) -> None:
         worktree_name: Worktree name (e.g., "main", "dev", "thunes")
         status: Work status ("complete", "working", "testing", "blocked")
     """
-    status_map = {"complete": 0.0, "working": 1.0, "testing": 2.0, "blocked": 3.0}
     lab_worktree_status.labels(worktree_name=worktree_name).set(
-        status_map.get(status.lower(), 1.0)
+        WORKTREE_STATUS_VALUES.get(status.lower(), 1.0)
     )
 
 
@@ -216,7 +222,45 @@ def update_worktree_test_status(worktree_name: str, test_status: str) -> None:
         worktree_name: Worktree name (e.g., "main", "dev", "thunes")
         test_status: Test status ("unknown", "passing", "failing")
     """
-    status_map = {"unknown": 0.0, "passing": 1.0, "failing": 2.0}
     lab_worktree_test_status.labels(worktree_name=worktree_name).set(
-        status_map.get(test_status.lower(), 0.0)
+        WORKTREE_TEST_STATUS_VALUES.get(test_status.lower(), 0.0)
     )
+
+
+# Labelled gauge children, cached so repeated updates skip the labels() lookup
+_lab_gauge_children: dict[tuple[Gauge, str], Gauge] = {}
+
+
+def _lab_child(gauge: Gauge, label: str) -> Gauge:
+    """Return the cached child of a single-label LAB gauge."""
+    key = (gauge, label)
+    child = _lab_gauge_children.get(key)
+    if child is None:
+        child = _lab_gauge_children[key] = gauge.labels(label)
+    return child
+
+
+def update_lab_metrics(
+    mcp_health: Mapping[str, str],
+    worktree_status: Mapping[str, str],
+    worktree_test_status: Mapping[str, str],
+) -> None:
+    """Update all LAB infrastructure metrics in one sweep.
+
+    Args:
+        mcp_health: MCP server name → health status ("up", "down", "not_configured")
+        worktree_status: Worktree name → work status ("complete", "working", ...)
+        worktree_test_status: Worktree name → test status ("unknown", "passing", "failing")
+    """
+    for server_name, status in mcp_health.items():
+        _lab_child(lab_mcp_server_health, server_name).set(
+            MCP_HEALTH_VALUES.get(status.lower(), 0.0)
+        )
+    for worktree_name, status in worktree_status.items():
+        _lab_child(lab_worktree_status, worktree_name).set(
+            WORKTREE_STATUS_VALUES.get(status.lower(), 1.0)
+        )
+    for worktree_name, test_status in worktree_test_status.items():
+        _lab_child(lab_worktree_test_status, worktree_name).set(
+            WORKTREE_TEST_STATUS_VALUES.get(test_status.lower(), 0.0)
+        )
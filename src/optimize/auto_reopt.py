@@ -13,7 +13,7 @@ import pandas as pd
 
 from src.backtest.rsi_strategy import RSIStrategy
 from src.config import ARTIFACTS_DIR
-from src.data.binance_client import BinanceDataClient
+from src.data.binance_client import candle_count, get_data_client
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__, log_file="auto_reopt.log")
@@ -92,12 +92,10 @@ class WeeklyReoptimizer:
         Returns:
             DataFrame with OHLCV data
         """
-        client = BinanceDataClient(testnet=False)
+        client = get_data_client(testnet=False)
 
         # Calculate required klines
-        timeframe_hours = {"1h": 1, "4h": 4, "1d": 24}
-        hours_per_candle = timeframe_hours.get(self.timeframe, 1)
-        required_klines = int((self.lookback_days * 24) / hours_per_candle)
+        required_klines = candle_count(self.timeframe, self.lookback_days)
 
         df = client.get_historical_klines(
             symbol=self.symbol,
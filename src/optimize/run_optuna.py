@@ -9,7 +9,7 @@ from optuna.trial import Trial
 
 from src.backtest.strategy import SMAStrategy
 from src.config import ARTIFACTS_DIR, ensure_directories
-from src.data.binance_client import BinanceDataClient
+from src.data.binance_client import get_data_client
 from src.utils.logger import setup_logger
 
 # Ensure required directories exist (entrypoint responsibility)
@@ -42,7 +42,7 @@ class OptunaOptimizer:
         # Fetch data once for all trials
         # Use production Binance for historical data (public endpoint, no auth required)
         logger.info(f"Fetching data for {symbol} ({timeframe})")
-        client = BinanceDataClient(testnet=False)
+        client = get_data_client(testnet=False)
 
         # Calculate required klines based on timeframe
         # Note: No longer need to calculate required_klines - auto-pagination fetches all data
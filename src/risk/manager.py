@@ -207,8 +207,9 @@ class RiskManager:
             # 6. Check cool-down period after loss
             if self.last_loss_time and side == "BUY":
                 cool_down_end = self.last_loss_time + timedelta(minutes=self.cool_down_minutes)
-                if datetime.utcnow() < cool_down_end:
-                    remaining = (cool_down_end - datetime.utcnow()).total_seconds() / 60
+                now = datetime.utcnow()
+                if now < cool_down_end:
+                    remaining = (cool_down_end - now).total_seconds() / 60
                     self._write_audit_log(
                         event="TRADE_REJECTED",
                         details={
@@ -462,8 +463,9 @@ class RiskManager:
         cool_down_remaining = None
         if self.last_loss_time:
             cool_down_end = self.last_loss_time + timedelta(minutes=self.cool_down_minutes)
-            if datetime.utcnow() < cool_down_end:
-                cool_down_remaining = (cool_down_end - datetime.utcnow()).total_seconds() / 60
+            now = datetime.utcnow()
+            if now < cool_down_end:
+                cool_down_remaining = (cool_down_end - now).total_seconds() / 60
 
         return {
             "kill_switch_active": self.kill_switch_active,
@@ -0,0 +1,21 @@
+"""JSON decoding that uses orjson when it is installed.
+
+orjson is an optional dependency. Without it, ``loads`` falls back to the
+standard library. Decode errors from either backend subclass
+``json.JSONDecodeError``.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+loads: Callable[[bytes | bytearray | str], Any]
+
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
+__all__ = ["loads"]
@@ -0,0 +1,204 @@
+"""Tests for Binance data client."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.data import binance_client
+from src.data.binance_client import BinanceDataClient, candle_count, get_data_client
+
+pytest.importorskip("pyarrow")
+
+HOUR_MS = 3_600_000
+START_MS = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+
+
+def make_klines(start_ms: int, count: int) -> list[list]:
+    """Build raw Binance kline rows for consecutive hourly candles."""
+    return [
+        [
+            start_ms + i * HOUR_MS,
+            "100.0",
+            "101.0",
+            "99.0",
+            f"{100 + i}.5",
+            "10.0",
+            start_ms + (i + 1) * HOUR_MS - 1,
+            "1000.0",
+            5,
+            "5.0",
+            "500.0",
+            "0",
+        ]
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[BinanceDataClient]:
+    """Create a client with a mocked REST client and a temporary kline cache."""
+    with (
+        patch("src.data.binance_client.Client") as MockClient,
+        patch.object(binance_client, "KLINES_CACHE_DIR", tmp_path),
+    ):
+        MockClient.return_value = MagicMock()
+        yield BinanceDataClient(testnet=False)
+
+
+def test_fixed_window_served_from_cache(client: BinanceDataClient) -> None:
+    """Test that a repeated fixed-window request skips the API."""
+    client.client.get_historical_klines.return_value = make_klines(START_MS, 24)
+
+    first = client.get_historical_klines("BTCUSDT", "1h", "1 Jan, 2024", "2 Jan, 2024")
+    second = client.get_historical_klines("BTCUSDT", "1h", "1 Jan, 2024", "2 Jan, 2024")
+
+    client.client.get_historical_klines.assert_called_once()
+    pd.testing.assert_frame_equal(first, second)
+    assert second["close"].dtype == "float64"
+
+
+def test_open_ended_request_fetches_only_new_candles(client: BinanceDataClient) -> None:
+    """Test that open-ended requests extend the cache from the last cached candle."""
+    client.client.get_historical_klines.return_value = make_klines(START_MS, 10)
+    client.get_historical_klines("BTCUSDT", "1h", str(START_MS))
+
+    # Last cached candle (index 9) is refetched along with two new ones
+    client.client.get_historical_klines.return_value = make_klines(START_MS + 9 * HOUR_MS, 3)
+    df = client.get_historical_klines("BTCUSDT", "1h", str(START_MS + 2 * HOUR_MS))
+
+    last_call = client.client.get_historical_klines.call_args.kwargs
+    assert last_call["start_str"] == START_MS + 9 * HOUR_MS
+    assert len(df) == 10
+    assert df.index[0] == pd.Timestamp(START_MS + 2 * HOUR_MS, unit="ms")
+    assert df.index.is_unique
+
+
+def test_cache_bypassed_when_disabled(client: BinanceDataClient) -> None:
+    """Test that use_cache=False always hits the API."""
+    client.client.get_historical_klines.return_value = make_klines(START_MS, 5)
+
+    for _ in range(2):
+        client.get_historical_klines("BTCUSDT", "1h", "1 Jan, 2024", "2 Jan, 2024", use_cache=False)
+
+    assert client.client.get_historical_klines.call_count == 2
+
+
+def test_cache_separated_by_network(client: BinanceDataClient, tmp_path: Path) -> None:
+    """Test that a testnet client misses klines cached by a production client."""
+    client.client.get_historical_klines.return_value = make_klines(START_MS, 24)
+    client.get_historical_klines("BTCUSDT", "1h", "1 Jan, 2024", "2 Jan, 2024")
+    client.get_historical_klines("BTCUSDT", "1h", str(START_MS))
+
+    with patch("src.data.binance_client.Client") as MockClient:
+        MockClient.return_value = MagicMock()
+        testnet = BinanceDataClient(testnet=True)
+    testnet.client.get_historical_klines.return_value = make_klines(START_MS, 24)
+
+    testnet.get_historical_klines("BTCUSDT", "1h", "1 Jan, 2024", "2 Jan, 2024")
+    testnet.get_historical_klines("BTCUSDT", "1h", str(START_MS))
+
+    assert testnet.client.get_historical_klines.call_count == 2
+    assert {path.name for path in tmp_path.glob("BTCUSDT_1h_*.parquet")} >= {
+        "BTCUSDT_1h_prod.parquet",
+        "BTCUSDT_1h_testnet.parquet",
+    }
+
+
+def test_relative_start_not_served_stale(client: BinanceDataClient) -> None:
+    """Test that a relative start without an end date refetches every call."""
+    client.client.get_historical_klines.side_effect = [
+        make_klines(START_MS, 24),
+        make_klines(START_MS + 24 * HOUR_MS, 24),
+    ]
+
+    first = client.get_historical_klines("BTCUSDT", "1h", "1 day ago UTC", limit=24)
+    second = client.get_historical_klines("BTCUSDT", "1h", "1 day ago UTC", limit=24)
+
+    assert client.client.get_historical_klines.call_count == 2
+    assert second.index[0] > first.index[-1]
+
+
+class FakeResponse:
+    """Minimal aiohttp response returning a JSON payload."""
+
+    def __init__(self, payload: list) -> None:
+        self.payload = payload
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def json(self) -> list:
+        return self.payload
+
+
+class FakeSession:
+    """aiohttp session stand-in serving 2500 hourly klines per symbol in pages."""
+
+    calls: list[dict[str, Any]] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def get(self, url: str, params: dict[str, Any]) -> FakeResponse:
+        self.calls.append(dict(params, url=url))
+        # First candle opening at or after startTime
+        offset = -(-(params["startTime"] - START_MS) // HOUR_MS)
+        count = max(0, min(params["limit"], 2500 - offset))
+        return FakeResponse(make_klines(START_MS + offset * HOUR_MS, count))
+
+
+def test_batch_fetch_paginates_each_symbol(client: BinanceDataClient) -> None:
+    """Test that the batch fetch pages through every symbol's klines."""
+    FakeSession.calls = []
+    with patch.object(binance_client.aiohttp, "ClientSession", FakeSession):
+        frames = client.get_historical_klines_batch(["BTCUSDT", "ETHUSDT"], "1h", str(START_MS))
+
+    assert list(frames) == ["BTCUSDT", "ETHUSDT"]
+    for df in frames.values():
+        assert len(df) == 2500
+        assert df.index.is_unique and df.index.is_monotonic_increasing
+        assert df["close"].dtype == "float64"
+    # Three pages per symbol (1000 + 1000 + 500), all against production
+    assert len(FakeSession.calls) == 6
+    assert {call["url"] for call in FakeSession.calls} == {binance_client.KLINES_URL}
+    client.client.get_historical_klines.assert_not_called()
+
+
+def test_get_data_client_shared_per_network() -> None:
+    """Test that get_data_client reuses one client per testnet flag."""
+    get_data_client.cache_clear()
+    try:
+        with patch("src.data.binance_client.Client") as MockClient:
+            MockClient.return_value = MagicMock()
+            prod = get_data_client(testnet=False)
+
+            assert get_data_client(testnet=False) is prod
+            assert get_data_client(testnet=True) is not prod
+            assert MockClient.call_count == 2
+    finally:
+        get_data_client.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("interval", "days", "expected"),
+    [("1h", 90, 2160), ("4h", 90, 540), ("1d", 90, 90), ("15m", 1, 96), ("3d", 2, 48)],
+)
+def test_candle_count(interval: str, days: int, expected: int) -> None:
+    """Test candle counts per interval, with unknown intervals counted as 1h."""
+    assert candle_count(interval, days) == expected
@@ -0,0 +1,256 @@
+"""Tests for CPU indicator implementations in the feature engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.processors._indicator_kernels import NUMBA_AVAILABLE
+from src.data.processors.gpu_features import GPUFeatureEngine, _adx_np, _rolling_sums_prefix
+
+
+@pytest.fixture
+def ohlc() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Random-walk OHLC arrays with a flat stretch (zero true range)."""
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.standard_normal(500))
+    high = close + rng.random(500)
+    low = close - rng.random(500)
+    high[100:130] = low[100:130] = close[100:130] = close[99]
+    return high, low, close
+
+
+@pytest.fixture
+def flat_after_moves() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Heavy-tailed random walk followed by 100 flat bars (running sums leave residues)."""
+    rng = np.random.default_rng(0)
+    steps = rng.lognormal(0, 1, 300) * rng.choice([-1, 1], 300) * 0.03
+    close = 50000 * np.exp(np.cumsum(steps))
+    high = close * (1 + rng.random(300) * 0.03)
+    low = close * (1 - rng.random(300) * 0.03)
+    flat = np.full(100, close[-1])
+    return np.r_[high, flat], np.r_[low, flat], np.r_[close, flat]
+
+
+def _adx_pandas(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
+    """Reference ADX built from pandas rolling means."""
+    high_diff = high.diff()
+    low_diff = -low.diff()
+    plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
+    minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
+
+    prev_close = close.shift(1)
+    tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1)
+    atr = tr.max(axis=1).rolling(period).mean()
+
+    plus_di = 100 * (plus_dm.rolling(period).mean() / atr)
+    minus_di = 100 * (minus_dm.rolling(period).mean() / atr)
+    dx = 100 * ((plus_di - minus_di).abs() / (plus_di + minus_di))
+    return dx.rolling(period).mean()
+
+
+def test_adx_np_matches_pandas(ohlc: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+    """Test the NumPy ADX against the pandas reference, including NaN placement."""
+    high, low, close = ohlc
+    expected = _adx_pandas(pd.Series(high), pd.Series(low), pd.Series(close), 14).to_numpy()
+
+    result = _adx_np(high, low, close, 14)
+
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_atr_matches_pandas(ohlc: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+    """Test the ndarray ATR against the concat/max reference, including a NaN gap."""
+    high, low, close = (pd.Series(a.copy()) for a in ohlc)
+    high.iloc[200] = np.nan
+    close.iloc[300] = np.nan
+    prev_close = close.shift(1)
+    tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1)
+    expected = tr.max(axis=1).rolling(14).mean()
+
+    result = GPUFeatureEngine(use_gpu=False)._atr(high, low, close, 14)
+
+    pd.testing.assert_series_equal(result, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("length", [1, 13, 14, 27, 28, 500])
+def test_adx_kernel_matches_numpy(
+    ohlc: tuple[np.ndarray, np.ndarray, np.ndarray], length: int
+) -> None:
+    """Test the fused numba ADX kernel against the NumPy implementation."""
+    from src.data.processors._indicator_kernels import adx_kernel
+
+    high, low, close = (a[:length].copy() for a in ohlc)
+
+    result = adx_kernel(high, low, close, 14)
+
+    np.testing.assert_allclose(
+        result, _adx_np(high, low, close, 14), rtol=1e-9, atol=1e-9, equal_nan=True
+    )
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+def test_adx_kernel_nan_on_flat_stretch(
+    flat_after_moves: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Test that window-sum residues after volatile bars do not turn into a trend."""
+    from src.data.processors._indicator_kernels import adx_kernel
+
+    high, low, close = flat_after_moves
+    expected = _adx_np(high, low, close, 14)
+
+    result = adx_kernel(high, low, close, 14)
+
+    assert np.isnan(result[330:]).all()
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_gpu_only_entry_point_requires_gpu() -> None:
+    """Test that the device-resident entry point refuses to run on the CPU engine."""
+    with pytest.raises(RuntimeError, match="requires cuDF"):
+        GPUFeatureEngine(use_gpu=False).calculate_all_features_gpu(pd.DataFrame())
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+def test_rolling_means_kernel_matches_pandas() -> None:
+    """Test the fused multi-window mean against pandas rolling means, with NaN gaps."""
+    from src.data.processors._indicator_kernels import rolling_means_kernel
+
+    rng = np.random.default_rng(9)
+    values = 100 + np.cumsum(rng.standard_normal(400))
+    values[50] = np.nan
+    values[200:205] = np.nan
+    windows = np.array([1, 5, 20, 200, 500])
+
+    result = rolling_means_kernel(values, windows)
+
+    for row, window in zip(result, windows, strict=True):
+        expected = pd.Series(values).rolling(window).mean().to_numpy()
+        np.testing.assert_allclose(row, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_rolling_sums_prefix_matches_pandas() -> None:
+    """Test prefix-sum rolling sums against pandas rolling sums, with NaN gaps."""
+    rng = np.random.default_rng(21)
+    values = pd.Series(100 + np.cumsum(rng.standard_normal(400)))
+    values.iloc[50] = np.nan
+    values.iloc[200:205] = np.nan
+    windows = [1, 5, 20, 200, 500]
+
+    for window, result in zip(windows, _rolling_sums_prefix(values, windows), strict=True):
+        expected = values.rolling(window).sum()
+        pd.testing.assert_series_equal(result, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+def test_ewm_means_kernel_matches_pandas() -> None:
+    """Test the fused multi-span EMA bit for bit against pandas, with NaN gaps."""
+    from src.data.processors._indicator_kernels import ewm_means_kernel
+
+    rng = np.random.default_rng(17)
+    values = 100 + np.cumsum(rng.standard_normal(400))
+    values[:3] = np.nan
+    values[120] = np.nan
+    values[250:260] = values[249]
+    spans = [9, 12, 26, 50]
+
+    result = ewm_means_kernel(values, np.array([2.0 / (1.0 + span) for span in spans]))
+
+    for row, span in zip(result, spans, strict=True):
+        expected = pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+        np.testing.assert_array_equal(row, expected)
+
+
+def test_calculate_all_features_leaves_input_untouched(
+    ohlc: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Test that features are attached to a new frame and recomputed columns are replaced."""
+    high, low, close = ohlc
+    df = pd.DataFrame({"open": close, "high": high, "low": low, "close": close, "volume": 1.0})
+    engine = GPUFeatureEngine(use_gpu=False)
+
+    features = engine.calculate_all_features(df)
+    again = engine.calculate_all_features(features)
+
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert list(features.columns[:5]) == list(df.columns)
+    assert "rsi_14" in features and "price_sma50_ratio" in features
+    assert again.columns.is_unique
+    assert set(again.columns) == set(features.columns)
+
+
+def test_feature_dtype_casts_indicators_only(
+    ohlc: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Test that feature_dtype narrows indicator columns but leaves OHLCV as given."""
+    high, low, close = ohlc
+    df = pd.DataFrame({"open": close, "high": high, "low": low, "close": close, "volume": 1.0})
+
+    full = GPUFeatureEngine(use_gpu=False).calculate_all_features(df)
+    narrow = GPUFeatureEngine(use_gpu=False, feature_dtype="float32").calculate_all_features(df)
+
+    assert (narrow[df.columns].dtypes == np.float64).all()
+    assert (narrow.drop(columns=df.columns).dtypes == np.float32).all()
+    pd.testing.assert_frame_equal(narrow, full.astype(narrow.dtypes.to_dict()))
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+def test_rsi_and_obv_kernels_match_pandas(
+    ohlc: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Test the RSI and OBV kernels against the pandas formulations they replace."""
+    from src.data.processors._indicator_kernels import obv_kernel, rsi_kernel
+
+    _, _, close = ohlc
+    close = close.copy()
+    close[200] = np.nan
+    volume = np.random.default_rng(5).random(len(close)) * 10
+    volume[300] = np.nan
+    prices = pd.Series(close)
+
+    delta = prices.diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta).where(delta < 0, 0).rolling(14).mean()
+    expected_rsi = 100 - (100 / (1 + gain / loss))
+    expected_obv = (volume * np.sign(delta).fillna(0)).cumsum()
+
+    np.testing.assert_allclose(
+        rsi_kernel(close, 14), expected_rsi, rtol=1e-9, atol=1e-9, equal_nan=True
+    )
+    np.testing.assert_allclose(
+        obv_kernel(close, volume), expected_obv, rtol=1e-9, atol=1e-9, equal_nan=True
+    )
+
+
+def test_bollinger_features_finite_on_flat_stretch(
+    flat_after_moves: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """Test that a zero-width band yields NaN band features rather than inf."""
+    high, low, close = flat_after_moves
+    df = pd.DataFrame({"open": close, "high": high, "low": low, "close": close, "volume": 1.0})
+
+    features = GPUFeatureEngine(use_gpu=False).calculate_all_features(df)
+
+    assert not np.isinf(features.to_numpy()).any()
+    assert features["bb_position"].iloc[320:].isna().all()
+    assert features["bb_width"].iloc[320:].eq(0).all()
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("period", [14, 21])
+def test_rsi_kernel_nan_on_flat_stretch(
+    flat_after_moves: tuple[np.ndarray, np.ndarray, np.ndarray], period: int
+) -> None:
+    """Test that RSI is NaN (0/0) on a flat stretch that follows price movement."""
+    from src.data.processors._indicator_kernels import rsi_kernel
+
+    _, _, close = flat_after_moves
+    delta = pd.Series(close).diff()
+    gain = delta.where(delta > 0, 0).rolling(period).mean()
+    loss = (-delta).where(delta < 0, 0).rolling(period).mean()
+    expected = 100 - (100 / (1 + gain / loss))
+
+    result = rsi_kernel(close, period)
+
+    assert np.isnan(result[300 + period :]).all()
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
@@ -235,3 +235,32 @@ def test_get_position_history(tracker: PositionTracker) -> None:
     assert len(history) == 3
     assert all(p.status == "CLOSED" for p in history)
     assert all(p.symbol == "BTCUSDT" for p in history)
+
+
+def test_snapshot(tracker: PositionTracker) -> None:
+    """Test reading open positions, history and count in one call."""
+    for i in range(2):
+        tracker.open_position(
+            symbol="BTCUSDT",
+            quantity=Decimal("0.1"),
+            entry_price=Decimal("50000.00"),
+            order_id=f"entry_{i}",
+        )
+        tracker.close_position(
+            symbol="BTCUSDT",
+            exit_price=Decimal("51000.00"),
+            exit_order_id=f"exit_{i}",
+        )
+    tracker.open_position(
+        symbol="ETHUSDT",
+        quantity=Decimal("1.0"),
+        entry_price=Decimal("3000.00"),
+        order_id="eth_entry",
+    )
+
+    open_positions, history, open_count = tracker.snapshot(history_limit=1)
+
+    assert [p.symbol for p in open_positions] == ["ETHUSDT"]
+    assert len(history) == 1
+    assert history[0].status == "CLOSED"
+    assert open_count == 1
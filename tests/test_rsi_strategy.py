@@ -0,0 +1,165 @@
+"""Tests for RSI mean reversion strategy."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import vectorbt as vbt
+
+from src.backtest import rsi_strategy
+from src.backtest._signal_kernels import rsi_kernel, rsi_signals_kernel, stop_loss_kernel
+from src.backtest.rsi_strategy import RSIStrategy
+
+
+@pytest.fixture
+def sample_data() -> pd.DataFrame:
+    """Create random-walk OHLCV data for testing."""
+    rng = np.random.default_rng(3)
+    close = 50000 * np.exp(np.cumsum(rng.standard_normal(500) * 0.01))
+    dates = pd.date_range(start="2024-01-01", periods=500, freq="1h")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": np.ones(500),
+        },
+        index=dates,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_rsi_cache() -> None:
+    """Start every test with an empty RSI cache."""
+    rsi_strategy._rsi_cache.clear()
+
+
+def test_generate_signals(sample_data: pd.DataFrame) -> None:
+    """Test signal generation shape and dtype."""
+    entries, exits = RSIStrategy().generate_signals(sample_data)
+
+    assert entries.index.equals(sample_data.index)
+    assert exits.index.equals(sample_data.index)
+    assert entries.dtype == bool
+    assert exits.dtype == bool
+    assert entries.any()
+
+
+def test_rsi_reused_across_threshold_sweep(sample_data: pd.DataFrame) -> None:
+    """Test that strategies sharing prices and period compute RSI once."""
+    with patch.object(rsi_strategy, "rsi_kernel", wraps=rsi_kernel) as mock_kernel:
+        for oversold in (20.0, 25.0, 30.0):
+            RSIStrategy(rsi_period=14, oversold_threshold=oversold).generate_signals(sample_data)
+        RSIStrategy(rsi_period=7).generate_signals(sample_data)
+
+    assert mock_kernel.call_count == 2
+
+
+@pytest.mark.parametrize("period", [1, 2, 14, 21])
+def test_rsi_kernel_matches_vectorbt(period: int) -> None:
+    """Test the RSI kernel against vbt.RSI, including flat stretches and NaN gaps."""
+    rng = np.random.default_rng(5)
+    close = 100 + np.cumsum(rng.standard_normal(300))
+    close[50:80] = close[49]
+    close[120] = np.nan
+    close[200:203] = np.nan
+    shifted = pd.Series(close).shift(1)
+
+    expected = vbt.RSI.run(shifted, window=period).rsi.to_numpy()
+
+    np.testing.assert_array_equal(rsi_kernel(shifted.to_numpy(), period), expected)
+
+
+def test_stop_loss_kernel_matches_pandas() -> None:
+    """Test the stop-loss kernel against the ffill/cumsum reference."""
+    rng = np.random.default_rng(11)
+    close = pd.Series(100 + np.cumsum(rng.standard_normal(400)))
+    close.iloc[150] = np.nan
+    entries = pd.Series(rng.random(400) < 0.03)
+    entries.iloc[150] = True  # entry on a missing price keeps the previous entry price
+
+    entry_prices = close.where(entries).ffill()
+    price_change_pct = ((close - entry_prices) / entry_prices) * 100
+    expected = (price_change_pct < -2.0) & (entries.cumsum() > 0)
+
+    result = stop_loss_kernel(close.to_numpy(), entries.to_numpy(), 2.0)
+
+    np.testing.assert_array_equal(result, expected.to_numpy())
+    assert result.any()
+
+
+def test_rsi_signals_kernel_matches_separate_passes() -> None:
+    """Test the fused signal kernel against crossings and stop-loss computed apart."""
+    rng = np.random.default_rng(13)
+    close = pd.Series(100 + np.cumsum(rng.standard_normal(600)))
+    close.iloc[300] = np.nan
+    rsi = pd.Series(rsi_kernel(close.shift(1).to_numpy(), 5))
+    prev_rsi = rsi.shift(1)
+
+    expected_entries = (rsi < 30.0) & (prev_rsi >= 30.0)
+    expected_exits = ((rsi > 70.0) & (prev_rsi <= 70.0)) | stop_loss_kernel(
+        close.to_numpy(), expected_entries.to_numpy(), 1.5
+    )
+
+    entries, exits = rsi_signals_kernel(rsi.to_numpy(), close.to_numpy(), 30.0, 70.0, 1.5)
+
+    np.testing.assert_array_equal(entries, expected_entries.to_numpy())
+    np.testing.assert_array_equal(exits, expected_exits.to_numpy())
+    assert entries.any() and exits.any()
+
+
+def test_generate_signals_grid_matches_single_runs(sample_data: pd.DataFrame) -> None:
+    """Test that every grid column equals the single-strategy signals."""
+    strategy = RSIStrategy(stop_loss_pct=2.0)
+    periods, oversolds, overboughts = [7, 14], [25.0, 30.0, 35.0], [65.0, 70.0]
+
+    entries, exits = strategy.generate_signals_grid(sample_data, periods, oversolds, overboughts)
+
+    assert entries.shape == (len(sample_data), 12)
+    for period in periods:
+        for oversold in oversolds:
+            for overbought in overboughts:
+                single = RSIStrategy(period, oversold, overbought, stop_loss_pct=2.0)
+                expected_entries, expected_exits = single.generate_signals(sample_data)
+                column = (period, oversold, overbought)
+                np.testing.assert_array_equal(entries[column], expected_entries)
+                np.testing.assert_array_equal(exits[column], expected_exits)
+
+
+def test_sweep_total_returns_match_backtests(sample_data: pd.DataFrame) -> None:
+    """Test that the parallel sweep reproduces vectorbt total returns."""
+    returns = RSIStrategy.sweep_total_returns(
+        sample_data, [7, 14], [25.0, 30.0], [70.0], [1.0, 3.0]
+    )
+
+    assert len(returns) == 8
+    for (period, oversold, overbought, stop_loss), total_return in returns.items():
+        strategy = RSIStrategy(period, oversold, overbought, stop_loss)
+        portfolio = strategy.backtest(sample_data)
+        assert total_return == pytest.approx(portfolio.total_return(), abs=1e-12)
+
+
+def test_update_matches_batch_signals(sample_data: pd.DataFrame) -> None:
+    """Test that streaming updates reproduce generate_signals bar by bar."""
+    strategy = RSIStrategy(rsi_period=7, oversold_threshold=35.0, stop_loss_pct=1.0)
+    entries, exits = strategy.generate_signals(sample_data)
+
+    streamed = [strategy.update(close) for close in sample_data["close"]]
+
+    np.testing.assert_array_equal([entry for entry, _ in streamed], entries)
+    np.testing.assert_array_equal([exit_ for _, exit_ in streamed], exits)
+    assert entries.any() and exits.any()
+
+    strategy.reset()
+    assert strategy.update(sample_data["close"].iloc[0]) == (False, False)
+
+
+def test_backtest_runs(sample_data: pd.DataFrame) -> None:
+    """Test that backtest completes and reports statistics."""
+    strategy = RSIStrategy()
+    portfolio = strategy.backtest(sample_data, initial_capital=10000.0)
+
+    stats = strategy.get_stats(portfolio)
+    assert "Total Return [%]" in stats
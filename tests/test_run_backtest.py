@@ -0,0 +1,33 @@
+"""Tests for the backtest runner."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.rsi_strategy import RSIStrategy
+from src.backtest.run_backtest import write_stats_csv
+
+
+@pytest.mark.parametrize("volatility", [0.01, 0.0], ids=["trades", "no_trades"])
+def test_write_stats_csv_matches_pandas(tmp_path: Path, volatility: float) -> None:
+    """Test that the stats writer produces the same file as Series.to_csv.
+
+    A flat price series never trades, leaving NaN ratios and NaT durations.
+    """
+    rng = np.random.default_rng(7)
+    close = 50000 * np.exp(np.cumsum(rng.standard_normal(500) * volatility))
+    df = pd.DataFrame(
+        {"open": close, "high": close, "low": close, "close": close, "volume": 1.0},
+        index=pd.date_range(start="2024-01-01", periods=500, freq="1h"),
+    )
+    strategy = RSIStrategy()
+    stats = strategy.get_stats(strategy.backtest(df))
+
+    expected_file = tmp_path / "expected.csv"
+    output_file = tmp_path / "stats.csv"
+    stats.to_csv(expected_file)
+    write_stats_csv(stats, output_file)
+
+    assert output_file.read_text() == expected_file.read_text()
@@ -1,7 +1,9 @@
 """Tests for trading strategy."""
 
+import numpy as np
 import pandas as pd
 import pytest
+import vectorbt as vbt
 
 from src.backtest.strategy import SMAStrategy
 
@@ -49,3 +51,21 @@ def test_backtest_runs(sample_data: pd.DataFrame) -> None:
     assert portfolio is not None
     stats = strategy.get_stats(portfolio)
     assert "Total Return [%]" in stats
+
+
+def test_generate_signals_match_vectorbt_ma() -> None:
+    """Test that SMA crossings match vbt.MA crossover signals on a random walk."""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range(start="2024-01-01", periods=1000, freq="1h")
+    close = pd.Series(100 + np.cumsum(rng.standard_normal(1000)), index=dates)
+    close.iloc[50:60] = close.iloc[49]  # flat stretch produces equal SMAs
+
+    entries, exits = SMAStrategy(fast_window=10, slow_window=30).generate_signals(
+        pd.DataFrame({"close": close})
+    )
+
+    fast = vbt.MA.run(close.shift(1), 10)
+    slow = vbt.MA.run(close.shift(1), 30)
+    np.testing.assert_array_equal(entries, fast.ma_crossed_above(slow))
+    np.testing.assert_array_equal(exits, fast.ma_crossed_below(slow))
+    assert entries.any() and exits.any()
@@ -1,5 +1,6 @@
 """Tests for Telegram notification system."""
 
+import asyncio
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,7 +12,7 @@ from src.alerts.telegram import TelegramBot, send_alert
 @pytest.fixture
 def telegram_bot() -> TelegramBot:
     """Create TelegramBot instance with mocked Bot."""
-    with patch("src.alerts.telegram.Bot") as MockBot:
+    with patch("src.alerts.telegram.ExtBot") as MockBot:
         mock_bot_instance = MagicMock()
         # Mock async send_message method
         mock_bot_instance.send_message = AsyncMock()
@@ -66,6 +67,19 @@ async def test_send_message_disabled(disabled_telegram_bot: TelegramBot) -> None
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_alerts_disabled(disabled_telegram_bot: TelegramBot) -> None:
+    """Test that alert methods return early when Telegram is disabled."""
+    with patch.object(TelegramBot, "_timestamp") as mock_timestamp:
+        result = await disabled_telegram_bot.send_kill_switch_alert(Decimal("25"), Decimal("20"))
+        assert result is False
+        result = await disabled_telegram_bot.send_custom_alert("Title", {"key": "value"})
+        assert result is False
+
+    # No message was formatted
+    mock_timestamp.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_send_kill_switch_alert(telegram_bot: TelegramBot) -> None:
     """Test kill-switch alert formatting and sending."""
@@ -211,9 +225,29 @@ def test_send_message_sync(telegram_bot: TelegramBot) -> None:
     telegram_bot._mock_bot.send_message.assert_called_once()
 
 
+def test_send_message_sync_reuses_background_loop(telegram_bot: TelegramBot) -> None:
+    """Test that synchronous sends share one persistent event loop."""
+    loops = []
+
+    async def record_loop(**kwargs: object) -> None:
+        loops.append(asyncio.get_running_loop())
+
+    telegram_bot._mock_bot.send_message.side_effect = record_loop
+
+    assert telegram_bot.send_message_sync("First") is True
+    assert telegram_bot.send_message_sync("Second") is True
+
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+    assert loops[0].is_running()
+
+
 def test_send_alert_convenience_function() -> None:
     """Test the send_alert convenience function."""
-    with patch("src.alerts.telegram.TelegramBot") as MockBot:
+    with (
+        patch("src.alerts.telegram.TelegramBot") as MockBot,
+        patch("src.alerts.telegram._default_bot", None),
+    ):
         mock_instance = MagicMock()
         mock_instance.send_message_sync.return_value = True
         MockBot.return_value = mock_instance
@@ -224,6 +258,90 @@ def test_send_alert_convenience_function() -> None:
         mock_instance.send_message_sync.assert_called_once_with("Test convenience")
 
 
+def test_send_alert_reuses_default_bot() -> None:
+    """Test that send_alert builds the default bot once and reuses it."""
+    with (
+        patch("src.alerts.telegram.TelegramBot") as MockBot,
+        patch("src.alerts.telegram._default_bot", None),
+    ):
+        send_alert("First")
+        send_alert("Second")
+
+        MockBot.assert_called_once()
+        assert MockBot.return_value.send_message_sync.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_silent_messages_are_batched(telegram_bot: TelegramBot) -> None:
+    """Test that silent messages sent together go out as one message."""
+    results = await asyncio.gather(
+        telegram_bot.send_message("First", disable_notification=True),
+        telegram_bot.send_message("Second", disable_notification=True),
+    )
+
+    assert results == [True, True]
+    telegram_bot._mock_bot.send_message.assert_called_once()
+    call_kwargs = telegram_bot._mock_bot.send_message.call_args.kwargs
+    assert call_kwargs["text"] == "First\n\n---\n\nSecond"
+    assert call_kwargs["disable_notification"] is True
+
+
+@pytest.mark.asyncio
+async def test_batched_messages_respect_length_limit(telegram_bot: TelegramBot) -> None:
+    """Test that batches are split to stay within Telegram's message limit."""
+    long_message = "x" * 3000
+    await asyncio.gather(
+        telegram_bot.send_message(long_message, disable_notification=True),
+        telegram_bot.send_message(long_message, disable_notification=True),
+    )
+
+    assert telegram_bot._mock_bot.send_message.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_notifying_messages_bypass_batch(telegram_bot: TelegramBot) -> None:
+    """Test that messages which notify are sent immediately."""
+    await asyncio.gather(
+        telegram_bot.send_message("Urgent 1"),
+        telegram_bot.send_message("Urgent 2"),
+    )
+
+    assert telegram_bot._mock_bot.send_message.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_many(telegram_bot: TelegramBot) -> None:
+    """Test sending several messages concurrently, preserving result order."""
+    results = await telegram_bot.send_many(
+        [("Urgent 1", False), ("Quiet 1", True), ("Quiet 2", True)]
+    )
+
+    assert results == [True, True, True]
+    # Both silent messages share one batched send
+    assert telegram_bot._mock_bot.send_message.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_falls_back_to_single_sends(telegram_bot: TelegramBot) -> None:
+    """Test that one malformed message does not fail the messages batched with it."""
+    from telegram.error import BadRequest
+
+    async def reject_bad_markdown(**kwargs: object) -> None:
+        if "*unclosed" in str(kwargs["text"]):
+            raise BadRequest("Can't parse entities")
+
+    telegram_bot._mock_bot.send_message.side_effect = reject_bad_markdown
+
+    results = await telegram_bot.send_many(
+        [("Good 1", True), ("*unclosed", True), ("Good 2", True)]
+    )
+
+    assert results == [True, False, True]
+    # One rejected batch, then each message on its own
+    texts = [call.kwargs["text"] for call in telegram_bot._mock_bot.send_message.call_args_list]
+    assert texts[1:] == ["Good 1", "*unclosed", "Good 2"]
+
+
 @pytest.mark.asyncio
 async def test_telegram_error_handling(telegram_bot: TelegramBot) -> None:
     """Test error handling when Telegram API fails."""
@@ -239,8 +357,6 @@ async def test_telegram_error_handling(telegram_bot: TelegramBot) -> None:
 
 def test_emoji_usage_in_critical_alerts(telegram_bot: TelegramBot) -> None:
     """Test that critical alerts include appropriate emojis."""
-    import asyncio
-
     # Run async methods synchronously for simplicity
     asyncio.run(telegram_bot.send_kill_switch_alert(Decimal("25"), Decimal("20")))
 
@@ -0,0 +1,38 @@
+"""Tests for the audit trail validation script."""
+
+from pathlib import Path
+
+import pytest
+
+from scripts.validate_audit_trail import analyze_audit_trail, validate_jsonl_format
+
+
+def test_analyze_audit_trail_counts_and_tail(tmp_path: Path) -> None:
+    """Test event counts and the most recent entries from one scan."""
+    audit_file = tmp_path / "audit_trail.jsonl"
+    audit_file.write_text(
+        '{"timestamp": "t1", "event": "TRADE"}\n'
+        "\n"
+        '{"timestamp": "t2", "event": "VETO"}\n'
+        '{"timestamp": "t3", "event": "TRADE"}\n'
+    )
+
+    valid, event_counts, tail = analyze_audit_trail(audit_file, sample=2)
+
+    assert valid
+    assert event_counts == {"TRADE": 2, "VETO": 1}
+    assert [entry["timestamp"] for entry in tail] == ["t2", "t3"]
+
+
+@pytest.mark.parametrize("line", ["[1, 2]", '"x"', "3", "null"])
+def test_non_object_line_is_invalid(tmp_path: Path, line: str) -> None:
+    """Test that valid JSON which is not an object is reported instead of raising."""
+    audit_file = tmp_path / "audit_trail.jsonl"
+    audit_file.write_text(f'{{"timestamp": "t1", "event": "TRADE"}}\n{line}\n')
+
+    valid, event_counts, tail = analyze_audit_trail(audit_file)
+
+    assert not valid
+    assert event_counts == {"TRADE": 1}
+    assert len(tail) == 1
+    assert not validate_jsonl_format(audit_file)
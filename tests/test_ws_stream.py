@@ -75,6 +75,24 @@ class TestWebSocketHealthMonitor:
         monitor.stop_watchdog()
         assert monitor._running is False
 
+    def test_watchdog_stop_interrupts_wait(self) -> None:
+        """Test that stopping wakes the watchdog instead of waiting out its interval."""
+        from queue import Queue
+
+        monitor = WebSocketHealthMonitor(timeout_seconds=60, check_interval_seconds=30)
+        reconnect_queue: Queue[str] = Queue()
+
+        monitor.start_watchdog(reconnect_queue)
+        thread = monitor._watchdog_thread
+        assert thread is not None
+
+        start = time.monotonic()
+        monitor.stop_watchdog()
+
+        assert time.monotonic() - start < 1.0
+        assert not thread.is_alive()
+        assert reconnect_queue.empty()
+
 
 class TestBinanceWebSocketStream:
     """Tests for BinanceWebSocketStream."""
@@ -135,7 +153,7 @@ class TestBinanceWebSocketStream:
 
         stream._handle_message(test_msg)
 
-        # Wait for async processing (message queue → processing thread → _latest_data)
+        # Wait for async processing (message queue → processing thread → _latest)
         # Processing thread has 1s timeout on queue.get(), so 0.1s should be plenty
         time.sleep(0.1)
 
@@ -311,6 +329,97 @@ class TestBinanceWebSocketStream:
 
         stream.stop()
 
+    def test_stop_ends_control_thread(self, mock_twm: MagicMock) -> None:  # noqa: ARG002
+        """Test that stop() wakes the blocked control thread with its sentinel."""
+        stream = BinanceWebSocketStream(symbol="BTCUSDT", testnet=True)
+        stream.start()
+        control_thread = stream._control_thread
+        assert control_thread is not None and control_thread.is_alive()
+
+        stream.stop()
+
+        # Blocked on an untimed get(), the thread only exits if the sentinel woke it
+        assert not control_thread.is_alive()
+
+    def test_control_thread_survives_failed_reconnect(
+        self, mock_twm: MagicMock  # noqa: ARG002
+    ) -> None:
+        """Test that a reconnect error is logged and the control thread keeps running."""
+        stream = BinanceWebSocketStream(symbol="BTCUSDT", testnet=True)
+        stream.start()
+
+        with patch.object(stream, "_attempt_reconnect", side_effect=RuntimeError("boom")) as m:
+            stream._reconnect_queue.put("reconnect")
+            time.sleep(0.1)
+
+            m.assert_called_once()
+            assert stream._control_thread is not None
+            assert stream._control_thread.is_alive()
+
+        stream.stop()
+
+    def test_shared_streams_use_one_multiplex_connection(self) -> None:
+        """Test that shared streams share one manager and route messages by symbol."""
+        with (
+            patch("src.data.ws_stream.ThreadedWebsocketManager") as MockTWM,
+            patch.dict(BinanceWebSocketStream._shared_symbols, clear=True),
+        ):
+            manager = MagicMock()
+            manager.start_multiplex_socket.side_effect = ["key1", "key2", "key3"]
+            MockTWM.return_value = manager
+
+            btc = BinanceWebSocketStream(symbol="BTCUSDT", testnet=True, use_shared=True)
+            eth = BinanceWebSocketStream(symbol="ETHUSDT", testnet=True, use_shared=True)
+            btc.start()
+            eth.start()
+
+            MockTWM.assert_called_once()
+            manager.start_symbol_book_ticker_socket.assert_not_called()
+            streams = manager.start_multiplex_socket.call_args.kwargs["streams"]
+            assert streams == ["btcusdt@bookTicker", "ethusdt@bookTicker"]
+
+            BinanceWebSocketStream._dispatch(
+                {"stream": "ethusdt@bookTicker", "data": {"b": "2500.00", "a": "2500.50"}}
+            )
+            time.sleep(0.1)
+            assert eth.get_best_bid() == 2500.00
+            assert btc.get_latest_ticker() is None
+
+            # Stopping one symbol resubscribes the rest; the last one closes the manager
+            btc.stop()
+            streams = manager.start_multiplex_socket.call_args.kwargs["streams"]
+            assert streams == ["ethusdt@bookTicker"]
+            manager.stop.assert_not_called()
+
+            eth.stop()
+            manager.stop.assert_called_once()
+            assert BinanceWebSocketStream._shared_twm is None
+            assert not BinanceWebSocketStream._shared_symbols
+
+    def test_shared_streams_subscribe_only_when_started(self, mock_twm: MagicMock) -> None:
+        """Test that unstarted streams stay off the multiplex and conflicts are rejected."""
+        with patch.dict(BinanceWebSocketStream._shared_symbols, clear=True):
+            btc = BinanceWebSocketStream(symbol="BTCUSDT", testnet=True, use_shared=True)
+            BinanceWebSocketStream(symbol="ETHUSDT", testnet=True, use_shared=True)
+            btc.start()
+
+            streams = mock_twm.start_multiplex_socket.call_args.kwargs["streams"]
+            assert streams == ["btcusdt@bookTicker"]
+
+            duplicate = BinanceWebSocketStream(symbol="BTCUSDT", testnet=True, use_shared=True)
+            with pytest.raises(ValueError, match="already running"):
+                duplicate.start()
+            duplicate.stop()  # Must not unregister the running stream
+            assert BinanceWebSocketStream._shared_symbols == {"BTCUSDT": btc}
+
+            production = BinanceWebSocketStream(symbol="ETHUSDT", testnet=False, use_shared=True)
+            with pytest.raises(ValueError, match="testnet"):
+                production.start()
+            production.stop()
+
+            btc.stop()
+            assert BinanceWebSocketStream._shared_twm is None
+
 
 class TestWebSocketIntegration:
     """Integration tests for WebSocket stream (requires network)."""
@@ -14,7 +14,7 @@ import optuna
 import pandas as pd
 
 from src.backtest.strategy import SMAStrategy
-from src.data.binance_client import BinanceDataClient
+from src.data.binance_client import candle_count, get_data_client
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -22,16 +22,14 @@ logger = setup_logger(__name__)
 
 def fetch_data_for_period(symbol: str, start_date: str, end_date: str, timeframe: str = "1h"):
     """Fetch data for specific date range."""
-    client = BinanceDataClient(testnet=False)
+    client = get_data_client(testnet=False)
 
     # Calculate number of candles needed
     start_dt = datetime.strptime(start_date, "%Y-%m-%d")
     end_dt = datetime.strptime(end_date, "%Y-%m-%d")
     days = (end_dt - start_dt).days
 
-    timeframe_hours = {"1h": 1, "4h": 4, "1d": 24}
-    hours_per_candle = timeframe_hours.get(timeframe, 1)
-    required_klines = int((days * 24) / hours_per_candle)
+    required_klines = candle_count(timeframe, days)
 
     df = client.get_historical_klines(
         symbol=symbol,